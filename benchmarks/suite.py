@@ -0,0 +1,196 @@
+#! python3
+
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import sysconfig
+import tempfile
+import time
+import tracemalloc
+
+import pydrf
+from pydrf.buffer import iter_mmap_records
+from pydrf.lazy import LazyStarterPerformanceData, iter_lazy_records
+from pydrf.synthetic import iter_synthetic_rows, write_synthetic_charts
+from pydrf.table import StarterTable
+from pydrf.textchart import COMPACT_PLANS, PLANS, DecodePlan, iter_records, iter_rows
+from pydrf.threads import iter_threaded_records
+
+
+NARROW = {'S': ('horse_key', 'official_finish', 'odds', 'win_payoff')}
+
+
+def best_of(function, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def bytes_per_record(plan: DecodePlan, rows: list[list[str]]) -> float:
+    tracemalloc.start()
+    records = [plan.decode(row) for row in rows]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / len(records)
+
+
+def result(group: str, name: str, value: float, unit: str) -> dict:
+    return {'group': group, 'name': name, 'value': round(value, 4), 'unit': unit}
+
+
+def decode_benchmarks(rows: list[list[str]], repeat: int) -> list[dict]:
+    results = []
+    for record_type, plan in PLANS.items():
+        selected = [row for row in rows if row[0] == record_type]
+        if not selected:
+            continue
+        create = plan.record_class.create
+        decode = plan.decode
+        name = plan.record_class.__name__
+        before = best_of(lambda: [create(row) for row in selected], repeat) / len(selected) * 1e6
+        after = best_of(lambda: [decode(row) for row in selected], repeat) / len(selected) * 1e6
+        results += [
+            result('decode', f'{name}.create', before, 'us/row'),
+            result('decode', f'{name}.plan', after, 'us/row'),
+            result('decode', f'{name}.speedup', before / after, 'x'),
+        ]
+    return results
+
+
+def narrow_scan(path: str) -> None:
+    for record in iter_lazy_records(path):
+        if isinstance(record, LazyStarterPerformanceData):
+            for name in NARROW['S']:
+                getattr(record, name)
+
+
+def read_benchmarks(path: str, rows: int, repeat: int) -> list[dict]:
+    size = os.path.getsize(path)
+    cases = (
+        ('iter_rows', lambda: sum(1 for _ in iter_rows(path))),
+        ('iter_records', lambda: sum(1 for _ in iter_records(path))),
+        ('iter_records.compact', lambda: sum(1 for _ in iter_records(path, compact=True))),
+        ('iter_lazy_records.narrow', lambda: narrow_scan(path)),
+        ('StarterTable.from_rows', lambda: StarterTable.from_rows(iter_rows(path))),
+        ('iter_records.projected', lambda: sum(1 for _ in iter_records(path, record_types='S', fields=NARROW))),
+        ('iter_mmap_records', lambda: sum(1 for _ in iter_mmap_records(path))),
+        ('iter_mmap_records.projected',
+         lambda: sum(1 for _ in iter_mmap_records(path, record_types='S', fields=NARROW))),
+    )
+    results = []
+    for name, function in cases:
+        elapsed = best_of(function, repeat)
+        results += [
+            result('read', f'{name}.rows', rows / elapsed, 'rows/s'),
+            result('read', f'{name}.bytes', size / elapsed / 1e6, 'MB/s'),
+        ]
+    return results
+
+
+def thread_benchmarks(path: str, rows: int, repeat: int, workers: list[int]) -> list[dict]:
+    baseline = best_of(lambda: sum(1 for _ in iter_records(path)), repeat)
+    results = [result('threads', 'iter_records.rows', rows / baseline, 'rows/s')]
+    for count in workers:
+        elapsed = best_of(lambda: sum(1 for _ in iter_threaded_records(path, workers=count, chunk_size=1 << 16)),
+                          repeat)
+        results += [
+            result('threads', f'iter_threaded_records.{count}.rows', rows / elapsed, 'rows/s'),
+            result('threads', f'iter_threaded_records.{count}.speedup', baseline / elapsed, 'x'),
+        ]
+    return results
+
+
+def memory_benchmarks(rows: list[list[str]]) -> list[dict]:
+    results = []
+    for record_type, plan in PLANS.items():
+        selected = [row for row in rows if row[0] == record_type]
+        if not selected:
+            continue
+        name = plan.record_class.__name__
+        results += [
+            result('memory', f'{name}.dataclass', bytes_per_record(plan, selected), 'B/record'),
+            result('memory', f'{name}.compact', bytes_per_record(COMPACT_PLANS[record_type], selected), 'B/record'),
+        ]
+    return results
+
+
+def interpreter() -> dict:
+    return {
+        'executable': sys.executable,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'free_threaded_build': bool(sysconfig.get_config_var('Py_GIL_DISABLED')),
+        'gil': getattr(sys, '_is_gil_enabled', lambda: True)(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def run_interpreters(executables: list[str], arguments: list[str]) -> list[dict]:
+    reports = []
+    for executable in executables:
+        completed = subprocess.run([executable, __file__, *arguments], capture_output=True, text=True, check=True,
+                                   env={**os.environ, 'PYTHONPATH': os.path.dirname(os.path.dirname(pydrf.__file__))})
+        reports.append(json.loads(completed.stdout))
+    return reports
+
+
+def run(args: argparse.Namespace) -> dict:
+    groups = set(args.groups.split(','))
+    rows = list(iter_synthetic_rows(args.charts, args.seed))
+    results = []
+    if 'decode' in groups:
+        results += decode_benchmarks(rows, args.repeat)
+    if groups & {'read', 'threads'}:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'synthetic.txt')
+            with open(path, 'w', newline='', encoding='latin-1') as file:
+                write_synthetic_charts(file, args.charts, args.seed)
+            if 'read' in groups:
+                results += read_benchmarks(path, len(rows), args.repeat)
+            if 'threads' in groups:
+                workers = sorted({int(count) for count in args.workers.split(',')})
+                results += thread_benchmarks(path, len(rows), args.repeat, workers)
+    if 'memory' in groups:
+        results += memory_benchmarks(rows)
+    return {
+        'interpreter': interpreter(),
+        'parameters': {'charts': args.charts, 'seed': args.seed, 'repeat': args.repeat, 'rows': len(rows)},
+        'results': results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark pydrf decoding on synthetic charts.')
+    parser.add_argument('--charts', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--groups', default='decode,read,threads,memory')
+    parser.add_argument('--workers', default=f'1,2,4,{os.cpu_count() or 1}')
+    parser.add_argument('--interpreters', help='comma-separated interpreters to run, e.g. python3.13,python3.13t')
+    parser.add_argument('--output', help='write JSON results to this path instead of stdout')
+    args = parser.parse_args()
+
+    if args.interpreters:
+        arguments = ['--charts', str(args.charts), '--seed', str(args.seed), '--repeat', str(args.repeat),
+                     '--groups', args.groups, '--workers', args.workers]
+        report = {'runs': run_interpreters(args.interpreters.split(','), arguments)}
+    else:
+        report = run(args)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == '__main__':
+    main()
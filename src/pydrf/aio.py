@@ -0,0 +1,122 @@
+#! python3
+
+
+import asyncio
+import threading
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import Executor
+from itertools import islice
+
+from .textchart import DecodePlan, HeaderIndex, Record, Source, iter_rows, record_factories
+
+
+class BatchReader:
+
+    def __init__(self, source: Source, batch_size: int, factories: dict[str, Callable[[list[str]], Record]],
+                 encoding: str = 'latin-1') -> None:
+        self.source = source
+        self.batch_size = batch_size
+        self.factories = factories
+        self.encoding = encoding
+        self.rows: Iterator[list[str]] | None = None
+        self.closed = False
+        self.lock = threading.Lock()
+
+    def next_batch(self) -> list[Record]:
+        with self.lock:
+            batch = self.read()
+        if self.closed:
+            self.close()
+        return batch
+
+    def read(self) -> list[Record]:
+        if self.closed:
+            return []
+        if self.rows is None:
+            self.rows = iter_rows(self.source, self.encoding)
+        factories = self.factories
+        record_type = HeaderIndex.RECORD_TYPE_INDEX.value
+        batch = []
+        while not batch:
+            count = 0
+            for row in islice(self.rows, self.batch_size):
+                count += 1
+                if row:
+                    factory = factories.get(row[record_type])
+                    if factory is not None:
+                        batch.append(factory(row))
+            if count < self.batch_size:
+                break
+        return batch
+
+    def close(self) -> None:
+        self.closed = True
+        if self.lock.acquire(blocking=False):
+            try:
+                if self.rows is not None:
+                    self.rows.close()
+                    self.rows = None
+            finally:
+                self.lock.release()
+
+
+class Failure:
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+DONE = object()
+
+
+async def aiter_batches(sources: Iterable[Source], concurrency: int = 4, batch_size: int = 1000,
+                        executor: Executor | None = None, max_pending: int | None = None,
+                        encoding: str = 'latin-1', compact: bool = False,
+                        plans: dict[str, DecodePlan] | None = None) -> AsyncIterator[tuple[Source, list[Record]]]:
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending or concurrency * 2)
+    semaphore = asyncio.Semaphore(concurrency)
+    factories = record_factories(compact, plans)
+
+    async def produce(source: Source) -> None:
+        async with semaphore:
+            reader = BatchReader(source, batch_size, factories, encoding)
+            try:
+                while batch := await loop.run_in_executor(executor, reader.next_batch):
+                    await queue.put((source, batch))
+            finally:
+                reader.close()
+
+    async def supervise(tasks: list[asyncio.Task]) -> None:
+        try:
+            await asyncio.gather(*tasks)
+        except Exception as error:
+            await queue.put(Failure(error))
+        else:
+            await queue.put(DONE)
+
+    tasks = [asyncio.ensure_future(produce(source)) for source in sources]
+    supervisor = asyncio.ensure_future(supervise(tasks))
+    try:
+        while (item := await queue.get()) is not DONE:
+            if isinstance(item, Failure):
+                raise item.error
+            yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+        supervisor.cancel()
+        await asyncio.gather(*tasks, supervisor, return_exceptions=True)
+
+
+async def aiter_records(sources: Iterable[Source], concurrency: int = 4, batch_size: int = 1000,
+                        executor: Executor | None = None, max_pending: int | None = None,
+                        encoding: str = 'latin-1', compact: bool = False,
+                        plans: dict[str, DecodePlan] | None = None) -> AsyncIterator[Record]:
+    batches = aiter_batches(sources, concurrency, batch_size, executor, max_pending, encoding, compact, plans)
+    try:
+        async for _, batch in batches:
+            for record in batch:
+                yield record
+    finally:
+        await batches.aclose()
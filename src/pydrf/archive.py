@@ -0,0 +1,39 @@
+#! python3
+
+
+import io
+import zipfile
+from collections.abc import Callable, Iterable, Iterator
+from functools import partial
+from typing import TypeVar
+
+from .ingest import Path, map_files
+from .textchart import Record, iter_records, zip_members
+
+
+T = TypeVar('T')
+
+
+def archive_members(path: Path) -> list[str]:
+    with zipfile.ZipFile(path) as archive:
+        return zip_members(archive)
+
+
+def read_member(path: Path, name: str, compact: bool = False, encoding: str = 'latin-1') -> list[Record]:
+    with zipfile.ZipFile(path) as archive, archive.open(name) as member:
+        return list(iter_records(io.TextIOWrapper(member, encoding=encoding, newline=''), compact=compact))
+
+
+def map_members(path: Path, function: Callable[[Path, str], T] = read_member, workers: int | None = None,
+                chunksize: int = 1) -> Iterator[tuple[str, T]]:
+    yield from map_files(archive_members(path), partial(function, path), workers, chunksize)
+
+
+def iter_archive_records(paths: Iterable[Path], workers: int | None = None, chunksize: int = 1,
+                         compact: bool = False) -> Iterator[Record]:
+    for path in paths:
+        if zipfile.is_zipfile(path):
+            for _, records in map_members(path, partial(read_member, compact=compact), workers, chunksize):
+                yield from records
+        else:
+            yield from iter_records(path, compact=compact)
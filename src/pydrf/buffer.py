@@ -0,0 +1,128 @@
+#! python3
+
+
+import csv
+import mmap
+import re
+from collections.abc import Callable, Iterable, Iterator
+from os import PathLike
+
+from .textchart import (COMPACT_PLANS, PLANS, DecodePlan, Record, RecordTypes, selected_plans, to_float, to_int,
+                        to_str)
+
+
+Buffer = bytes | bytearray | memoryview | mmap.mmap
+BytesConverter = Callable[[bytes], object]
+
+SEPARATORS = {
+    b'\n': re.compile(rb'\n'),
+    b',': re.compile(rb','),
+}
+QUOTED_COMMA = re.compile(rb',"(?:[^",]*"")*[^",]*,')
+ESCAPED_QUOTE = re.compile(rb'""[^,]')
+CARRIAGE_RETURN = ord('\r')
+QUOTE = b'"'
+
+
+def bytes_to_int(value: bytes) -> int:
+    if value:
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    return int(0)
+
+
+def bytes_to_float(value: bytes) -> float:
+    if value:
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return float('nan')
+
+
+def bytes_converter(converter: Callable[[str], object], encoding: str) -> BytesConverter:
+    if converter is to_int:
+        return bytes_to_int
+    if converter is to_float:
+        return bytes_to_float
+    if converter is to_str:
+        return lambda value: value.decode(encoding).rstrip()
+    return lambda value: converter(value.decode(encoding))
+
+
+class BufferPlan:
+
+    def __init__(self, plan: DecodePlan, encoding: str = 'latin-1') -> None:
+        self.plan = plan
+        self.encoding = encoding
+        self.record_class = plan.record_class
+        self.columns = tuple(column for column, _ in plan.steps)
+        self.converters = tuple(bytes_converter(converter, encoding) for _, converter in plan.steps)
+        self.last_column = max(self.columns, default=0)
+
+    def decode(self, buffer: Buffer, start: int, end: int):
+        # Wanted rows are copied out of the buffer once and split up to the last projected column; only the
+        # projected columns are converted. Rows of other record types are never copied.
+        line = bytes(buffer[start:end])
+        last_column = self.last_column
+        parts = line.split(b',', last_column + 1)
+        if len(parts) <= last_column:
+            raise IndexError(f'{self.record_class.__name__} row has no column {last_column}')
+        cut = len(line) - len(parts[-1]) if len(parts) > last_column + 1 else len(line)
+        if QUOTED_COMMA.search(line, 0, cut) or ESCAPED_QUOTE.search(line, 0, cut):
+            return self.plan.decode(next(csv.reader([line.decode(self.encoding)])))
+        return self.record_class(*[
+            converter(parts[column].strip(QUOTE)) for column, converter in zip(self.columns, self.converters)
+        ])
+
+
+def buffer_plans(plans: dict[str, DecodePlan], encoding: str = 'latin-1') -> dict[bytes, BufferPlan]:
+    return {record_type.encode(encoding): BufferPlan(plan, encoding) for record_type, plan in plans.items()}
+
+
+def finder(buffer: Buffer) -> Callable[[bytes, int, int], int]:
+    if not isinstance(buffer, memoryview):
+        return buffer.find
+
+    def find(value: bytes, start: int, end: int) -> int:
+        match = SEPARATORS[value].search(buffer, start, end)
+        return -1 if match is None else match.start()
+    return find
+
+
+def iter_lines(buffer: Buffer) -> Iterator[tuple[int, int]]:
+    find = finder(buffer)
+    position, size = 0, len(buffer)
+    while position < size:
+        end = find(b'\n', position, size)
+        if end < 0:
+            end = size
+        yield position, end - 1 if end > position and buffer[end - 1] == CARRIAGE_RETURN else end
+        position = end + 1
+
+
+def iter_buffer_records(buffer: Buffer, encoding: str = 'latin-1', compact: bool = False,
+                        plans: dict[str, DecodePlan] | None = None,
+                        record_types: Iterable[RecordTypes] | None = None,
+                        fields: dict[RecordTypes, Iterable[str]] | None = None) -> Iterator[Record]:
+    plans = plans or (COMPACT_PLANS if compact else PLANS)
+    decoders = buffer_plans(selected_plans(plans, record_types, fields), encoding)
+    find = finder(buffer)
+    for start, end in iter_lines(buffer):
+        comma = find(b',', start, end)
+        decoder = decoders.get(bytes(buffer[start:end if comma < 0 else comma]).strip(QUOTE))
+        if decoder is not None:
+            yield decoder.decode(buffer, start, end)
+
+
+def iter_mmap_records(path: str | PathLike, encoding: str = 'latin-1', compact: bool = False,
+                      plans: dict[str, DecodePlan] | None = None,
+                      record_types: Iterable[RecordTypes] | None = None,
+                      fields: dict[RecordTypes, Iterable[str]] | None = None) -> Iterator[Record]:
+    with open(path, 'rb') as file:
+        if not file.seek(0, 2):
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield from iter_buffer_records(buffer, encoding, compact, plans, record_types, fields)
@@ -0,0 +1,252 @@
+#! python3
+
+
+import hashlib
+import mmap
+import os
+import struct
+from collections.abc import Iterator
+from dataclasses import dataclass
+from os import PathLike
+
+from .textchart import COMPACT_PLANS, PLANS, Code, Record, iter_records
+
+
+MAGIC = b'PYDRFSN3'
+HEADER = struct.Struct('<8sqq32sq')
+COUNT = struct.Struct('<q')
+ALIGNMENT = 8
+
+CODES: dict[str, type[Code]] = {code.__name__: code for code in (Code, *Code.__subclasses__())}
+
+
+@dataclass(frozen=True)
+class Fingerprint:
+    size: int
+    mtime_ns: int
+    sha256: bytes = bytes(32)
+
+    @staticmethod
+    def create(path: str | PathLike, content_hash: bool = False) -> 'Fingerprint':
+        stat = os.stat(path)
+        digest = bytes(32)
+        if content_hash:
+            with open(path, 'rb') as file:
+                digest = hashlib.file_digest(file, 'sha256').digest()
+        return Fingerprint(stat.st_size, stat.st_mtime_ns, digest)
+
+    def matches(self, other: 'Fingerprint', content_hash: bool = False) -> bool:
+        if content_hash:
+            return self.size == other.size and self.sha256 == other.sha256
+        return self.size == other.size and self.mtime_ns == other.mtime_ns
+
+
+def padding(length: int) -> bytes:
+    return bytes(-length % ALIGNMENT)
+
+
+def code_class(name: str, values: list) -> type[Code] | None:
+    kinds = {value.__class__ for value in values if value is not None}
+    if kinds <= {str} and None not in values:
+        return None
+    if not kinds:
+        return Code
+    if len(kinds) == 1:
+        kind = next(iter(kinds))
+        if issubclass(kind, Code) and CODES.get(kind.__name__) is kind:
+            return kind
+    found = ', '.join(sorted(kind.__name__ for kind in kinds) + (['None'] if None in values else []))
+    raise TypeError(f'{name} holds {found} values; snapshots store str or a single Code enum per column')
+
+
+def write_snapshot(path: str | PathLike, records: list[Record], fingerprint: Fingerprint) -> None:
+    types = []
+    grouped: dict[str, list[Record]] = {record_type: [] for record_type in PLANS}
+    classes = {
+        plan.record_class: record_type for plans in (PLANS, COMPACT_PLANS) for record_type, plan in plans.items()
+    }
+    for record in records:
+        record_type = classes[type(record)]
+        types.append(record_type)
+        grouped[record_type].append(record)
+
+    chunks = [HEADER.pack(MAGIC, fingerprint.size, fingerprint.mtime_ns, fingerprint.sha256, len(types))]
+    sequence = ''.join(types).encode('ascii')
+    chunks += [sequence, padding(len(sequence))]
+    for record_type, plan in PLANS.items():
+        selected = grouped[record_type]
+        chunks.append(COUNT.pack(len(selected)))
+        for name in plan.fields:
+            values = [getattr(record, name) for record in selected]
+            kind = plan.record_class.__dataclass_fields__[name].type
+            if kind is int:
+                chunks.append(struct.pack(f'<{len(values)}q', *values))
+            elif kind is float:
+                chunks.append(struct.pack(f'<{len(values)}d', *values))
+            elif (code := code_class(name, values)) is not None:
+                tag = code.__name__.encode('ascii')
+                members = {member: index for index, member in enumerate(code)}
+                chunks += [COUNT.pack(len(tag)), tag, padding(len(tag))]
+                chunks.append(struct.pack(f'<{len(values)}q', *[-1 if value is None else members[value]
+                                                                  for value in values]))
+            else:
+                chunks += [COUNT.pack(0)]
+                encoded = [value.encode('utf-8') for value in values]
+                offsets = [0]
+                for value in encoded:
+                    offsets.append(offsets[-1] + len(value))
+                blob = b''.join(encoded)
+                chunks += [struct.pack(f'<{len(offsets)}q', *offsets), blob, padding(len(blob))]
+
+    temporary = f'{os.fspath(path)}.{os.getpid()}.tmp'
+    with open(temporary, 'wb') as file:
+        file.writelines(chunks)
+    os.replace(temporary, path)
+
+
+class StringColumn:
+
+    def __init__(self, offsets: memoryview, blob: memoryview) -> None:
+        self.offsets = offsets
+        self.blob = blob
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        return str(self.blob[self.offsets[index]:self.offsets[index + 1]], 'utf-8')
+
+    def release(self) -> None:
+        self.offsets.release()
+        self.blob.release()
+
+
+class CodeColumn:
+
+    def __init__(self, indexes: memoryview, code: type[Code]) -> None:
+        self.indexes = indexes
+        self.members = tuple(code)
+
+    def __len__(self) -> int:
+        return len(self.indexes)
+
+    def __getitem__(self, index: int) -> Code | None:
+        position = self.indexes[index]
+        return None if position < 0 else self.members[position]
+
+    def release(self) -> None:
+        self.indexes.release()
+
+
+class Snapshot:
+
+    def __init__(self, path: str | PathLike) -> None:
+        self.file = open(path, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.map)
+        magic, size, mtime_ns, sha256, record_count = HEADER.unpack_from(self.view)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f'{os.fspath(path)} is not a pydrf snapshot')
+        self.fingerprint = Fingerprint(size, mtime_ns, sha256)
+        offset = HEADER.size
+        self.types = self.view[offset:offset + record_count]
+        offset += record_count + len(padding(record_count))
+        self.columns: dict[str, dict[str, memoryview | StringColumn | CodeColumn]] = {}
+        for record_type, plan in PLANS.items():
+            count, = COUNT.unpack_from(self.view, offset)
+            offset += COUNT.size
+            columns = self.columns[record_type] = {}
+            for name in plan.fields:
+                kind = plan.record_class.__dataclass_fields__[name].type
+                if kind is int or kind is float:
+                    end = offset + count * 8
+                    columns[name] = self.view[offset:end].cast('q' if kind is int else 'd')
+                    offset = end
+                    continue
+                length, = COUNT.unpack_from(self.view, offset)
+                offset += COUNT.size
+                if length:
+                    code = CODES[str(self.view[offset:offset + length], 'ascii')]
+                    offset += length + len(padding(length))
+                    end = offset + count * 8
+                    columns[name] = CodeColumn(self.view[offset:end].cast('q'), code)
+                    offset = end
+                else:
+                    end = offset + (count + 1) * 8
+                    offsets = self.view[offset:end].cast('q')
+                    length = offsets[count]
+                    columns[name] = StringColumn(offsets, self.view[end:end + length])
+                    offset = end + length + len(padding(length))
+
+    def __enter__(self) -> 'Snapshot':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def count(self, record_type: str) -> int:
+        return len(next(iter(self.columns[record_type].values())))
+
+    def column(self, record_type: str, name: str) -> memoryview | StringColumn | CodeColumn:
+        return self.columns[record_type][name]
+
+    def records(self) -> Iterator[Record]:
+        positions = {record_type: 0 for record_type in PLANS}
+        getters = {
+            record_type: (PLANS[record_type].record_class, tuple(columns.values()))
+            for record_type, columns in self.columns.items()
+        }
+        for code in self.types:
+            record_type = chr(code)
+            position = positions[record_type]
+            positions[record_type] = position + 1
+            record_class, columns = getters[record_type]
+            yield record_class(*[column[position] for column in columns])
+
+    def close(self) -> None:
+        for columns in getattr(self, 'columns', {}).values():
+            for column in columns.values():
+                column.release()
+        if hasattr(self, 'types'):
+            self.types.release()
+        self.view.release()
+        self.map.close()
+        self.file.close()
+
+
+class ChartCache:
+
+    def __init__(self, directory: str | PathLike, content_hash: bool = False) -> None:
+        self.directory = os.fspath(directory)
+        self.content_hash = content_hash
+        os.makedirs(self.directory, exist_ok=True)
+
+    def path_for(self, source: str | PathLike) -> str:
+        key = hashlib.sha1(os.path.abspath(source).encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, f'{key}.snapshot')
+
+    def is_valid(self, source: str | PathLike) -> bool:
+        path = self.path_for(source)
+        if not os.path.exists(path):
+            return False
+        with open(path, 'rb') as file:
+            magic, size, mtime_ns, sha256, _ = HEADER.unpack(file.read(HEADER.size).ljust(HEADER.size, b'\0'))
+        if magic != MAGIC:
+            return False
+        return Fingerprint(size, mtime_ns, sha256).matches(Fingerprint.create(source, self.content_hash),
+                                                             self.content_hash)
+
+    def load(self, source: str | PathLike) -> Snapshot:
+        path = self.path_for(source)
+        if not self.is_valid(source):
+            fingerprint = Fingerprint.create(source, self.content_hash)
+            write_snapshot(path, list(iter_records(source)), fingerprint)
+        return Snapshot(path)
+
+    def records(self, source: str | PathLike) -> Iterator[Record]:
+        with self.load(source) as snapshot:
+            yield from snapshot.records()
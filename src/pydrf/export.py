@@ -0,0 +1,191 @@
+#! python3
+
+
+import re
+import sqlite3
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from os import PathLike
+
+from .ingest import Path, iter_file_records
+from .textchart import COMPACT_PLANS, PLANS, Code, Record, RecordType
+
+
+SQL_TYPES: dict[type, str] = {
+    int: 'INTEGER',
+    float: 'REAL',
+    str: 'TEXT',
+}
+
+KEY_COLUMNS = ('chart_track_code', 'chart_race_date')
+
+INDEXED_COLUMNS: dict[str, tuple[tuple[str, ...], ...]] = {
+    RecordType.STARTER.value: (('horse_key',), ('jockey_key',), ('trainer_key',)),
+}
+
+
+def adapt_code(code: Code) -> str:
+    return code._value_
+
+
+for code_class in Code.__subclasses__():
+    sqlite3.register_adapter(code_class, adapt_code)
+
+
+def table_name(record_class: type) -> str:
+    return re.sub(r'(?<!^)(?=[A-Z])', '_', record_class.__name__).lower()
+
+
+def quote(name: str) -> str:
+    return f'"{name}"'
+
+
+@dataclass
+class Table:
+    name: str
+    record_class: type
+    fields: tuple[str, ...]
+    header: bool
+
+    @staticmethod
+    def create(record_type: str) -> 'Table':
+        record_class = PLANS[record_type].record_class
+        return Table(
+            table_name(record_class),
+            record_class,
+            tuple(field.name for field in fields(record_class)),
+            record_type == RecordType.HEADER.value
+        )
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        return self.fields if self.header else KEY_COLUMNS + self.fields
+
+    def create_sql(self) -> str:
+        types = {field.name: SQL_TYPES.get(field.type, 'TEXT') for field in fields(self.record_class)}
+        columns = [f'{quote(name)} {types.get(name, "TEXT")}' for name in self.columns]
+        if self.header:
+            columns.append('UNIQUE (track_code, race_date)')
+        return f'CREATE TABLE IF NOT EXISTS {quote(self.name)} ({", ".join(columns)})'
+
+    def insert_sql(self) -> str:
+        verb = 'INSERT OR REPLACE' if self.header else 'INSERT'
+        columns = ', '.join(map(quote, self.columns))
+        return f'{verb} INTO {quote(self.name)} ({columns}) VALUES ({", ".join("?" * len(self.columns))})'
+
+    def delete_sql(self) -> str:
+        return (f'DELETE FROM {quote(self.name)} '
+                f'WHERE chart_track_code = ? AND chart_race_date = ? AND race_number = ?')
+
+    def index_sql(self, record_type: str) -> list[str]:
+        if self.header:
+            return []
+        indexes = ((*KEY_COLUMNS, 'race_number'),) + INDEXED_COLUMNS.get(record_type, ())
+        return [
+            f'CREATE INDEX IF NOT EXISTS {quote("_".join((self.name, *columns)))} '
+            f'ON {quote(self.name)} ({", ".join(map(quote, columns))})'
+            for columns in indexes
+        ]
+
+
+TABLES: dict[str, Table] = {record_type: Table.create(record_type) for record_type in PLANS}
+
+CLASS_TABLES: dict[type, Table] = {
+    **{plan.record_class: TABLES[record_type] for record_type, plan in PLANS.items()},
+    **{plan.record_class: TABLES[record_type] for record_type, plan in COMPACT_PLANS.items()},
+}
+
+
+class SQLiteExporter:
+
+    def __init__(self, database: str | PathLike | sqlite3.Connection, batch_size: int = 5000) -> None:
+        if isinstance(database, sqlite3.Connection):
+            self.connection = database
+        else:
+            self.connection = sqlite3.connect(database)
+        self.batch_size = batch_size
+        self.create_tables()
+
+    def create_tables(self) -> None:
+        with self.connection:
+            for table in TABLES.values():
+                self.connection.execute(table.create_sql())
+
+    def create_indexes(self) -> None:
+        with self.connection:
+            for record_type, table in TABLES.items():
+                for sql in table.index_sql(record_type):
+                    self.connection.execute(sql)
+
+    def is_empty(self) -> bool:
+        header = TABLES[RecordType.HEADER.value]
+        return self.connection.execute(f'SELECT NOT EXISTS (SELECT 1 FROM {quote(header.name)})').fetchone()[0]
+
+    def delete_race(self, key: tuple[str, str, int]) -> None:
+        for table in TABLES.values():
+            if not table.header:
+                self.connection.execute(table.delete_sql(), key)
+
+    def export(self, records: Iterable[Record]) -> Counter[str]:
+        connection = self.connection
+        batch_size = self.batch_size
+        getters = {table.name: attrgetter(*table.fields) for table in TABLES.values()}
+        inserts = {table.name: table.insert_sql() for table in TABLES.values()}
+        batches: dict[str, list[tuple]] = {table.name: [] for table in TABLES.values()}
+        counts: Counter[str] = Counter()
+        replace = not self.is_empty()
+        replaced: set[tuple[str, str, int]] = set()
+        exported: set[tuple[str, str, int]] = set()
+        chart = ('', '')
+
+        def flush(name: str) -> None:
+            batch = batches[name]
+            if batch:
+                connection.executemany(inserts[name], batch)
+                counts[name] += len(batch)
+                batch.clear()
+
+        with connection:
+            for record in records:
+                table = CLASS_TABLES.get(type(record))
+                if table is None:
+                    continue
+                values = getters[table.name](record)
+                if table.header:
+                    chart = (record.track_code, record.race_date)
+                    replaced.clear()
+                else:
+                    key = (*chart, record.race_number)
+                    if key not in replaced:
+                        if key in exported:
+                            for name in batches:
+                                flush(name)
+                            self.delete_race(key)
+                        elif replace:
+                            self.delete_race(key)
+                        replaced.add(key)
+                        exported.add(key)
+                    values = (*chart, *values)
+                batch = batches[table.name]
+                batch.append(values)
+                if len(batch) >= batch_size:
+                    flush(table.name)
+            for name in batches:
+                flush(name)
+        self.create_indexes()
+        return counts
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+def export_records(database: str | PathLike | sqlite3.Connection, records: Iterable[Record],
+                   batch_size: int = 5000) -> Counter[str]:
+    return SQLiteExporter(database, batch_size).export(records)
+
+
+def export_files(database: str | PathLike | sqlite3.Connection, paths: Iterable[Path], workers: int | None = None,
+                 batch_size: int = 5000) -> Counter[str]:
+    return SQLiteExporter(database, batch_size).export(iter_file_records(paths, workers, compact=True))
@@ -0,0 +1,135 @@
+#! python3
+
+
+import csv
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from enum import Enum
+from os import PathLike
+
+from .textchart import (RACE_DATA_PLAN, STARTER_PERFORMANCE_DATA_PLAN, HeaderIndex, RaceData, RaceDataIndex,
+                        RecordType, StarterPerformanceData, StarterPerformanceDataIndex)
+
+
+TAIL_SIZE = 1 << 16
+
+
+class FollowEventType(Enum):
+    NEW_RACE = 'new_race'
+    RACE_UPDATED = 'race_updated'
+    RACE_OFFICIAL = 'race_official'
+    NEW_STARTER = 'new_starter'
+    STARTER_UPDATED = 'starter_updated'
+
+
+@dataclass
+class FollowEvent:
+    kind: FollowEventType
+    race_number: int
+    record: RaceData | StarterPerformanceData
+
+
+def row_digest(line: bytes) -> str:
+    return hashlib.blake2b(line.rstrip(b'\r\n'), digest_size=8).hexdigest()
+
+
+def tail_digest(tail: bytes) -> str:
+    return hashlib.blake2b(tail, digest_size=16).hexdigest()
+
+
+class ChartFollower:
+
+    def __init__(self, path: str | PathLike, checkpoint: str | PathLike | None = None,
+                 encoding: str = 'latin-1') -> None:
+        self.path = path
+        self.checkpoint = checkpoint
+        self.encoding = encoding
+        self.offset = 0
+        self.tail = ''
+        self.races: dict[str, str] = {}
+        self.official: dict[str, str] = {}
+        self.starters: dict[str, str] = {}
+        if checkpoint is not None and os.path.exists(checkpoint):
+            self.load()
+
+    def load(self) -> None:
+        with open(self.checkpoint, encoding='utf-8') as file:
+            state = json.load(file)
+        self.offset = state['offset']
+        self.tail = state.get('tail', '')
+        self.races = state['races']
+        self.official = state['official']
+        self.starters = state['starters']
+
+    def save(self) -> None:
+        state = {
+            'offset': self.offset,
+            'tail': self.tail,
+            'races': self.races,
+            'official': self.official,
+            'starters': self.starters,
+        }
+        temporary = f'{os.fspath(self.checkpoint)}.tmp'
+        with open(temporary, 'w', encoding='utf-8') as file:
+            json.dump(state, file)
+        os.replace(temporary, self.checkpoint)
+
+    def read_tail(self, file) -> bytes:
+        start = max(0, self.offset - TAIL_SIZE)
+        file.seek(start)
+        return file.read(self.offset - start)
+
+    def poll(self) -> list[FollowEvent]:
+        with open(self.path, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            tail = self.read_tail(file) if size >= self.offset else b''
+            if size < self.offset or tail_digest(tail) != self.tail:
+                self.offset = 0
+                tail = b''
+            file.seek(self.offset)
+            data = file.read()
+            end = data.rfind(b'\n') + 1
+            events: list[FollowEvent] = []
+            for line in data[:end].splitlines():
+                self.process(line, events)
+            self.offset += end
+            tail = (tail + data[max(0, end - TAIL_SIZE):end])[-TAIL_SIZE:]
+            self.tail = tail_digest(tail)
+        if self.checkpoint is not None:
+            self.save()
+        return events
+
+    def process(self, line: bytes, events: list[FollowEvent]) -> None:
+        if not line.strip():
+            return
+        row = next(csv.reader([line.decode(self.encoding)]))
+        record_type = row[HeaderIndex.RECORD_TYPE_INDEX.value]
+        if record_type == RecordType.RACE.value:
+            key = row[RaceDataIndex.RACE_NUMBER_INDEX.value].strip()
+            digest = row_digest(line)
+            previous = self.races.get(key)
+            if previous == digest:
+                return
+            self.races[key] = digest
+            race = RACE_DATA_PLAN.decode(row)
+            official = race.official_indicator and race.official_indicator != self.official.get(key, '')
+            if previous is None:
+                events.append(FollowEvent(FollowEventType.NEW_RACE, race.race_number, race))
+            elif not official:
+                events.append(FollowEvent(FollowEventType.RACE_UPDATED, race.race_number, race))
+            if official:
+                events.append(FollowEvent(FollowEventType.RACE_OFFICIAL, race.race_number, race))
+            self.official[key] = race.official_indicator
+        elif record_type == RecordType.STARTER.value:
+            key = '/'.join((row[StarterPerformanceDataIndex.RACE_NUMBER_INDEX.value].strip(),
+                            row[StarterPerformanceDataIndex.HORSE_KEY_INDEX.value].strip()))
+            digest = row_digest(line)
+            previous = self.starters.get(key)
+            if previous == digest:
+                return
+            self.starters[key] = digest
+            starter = STARTER_PERFORMANCE_DATA_PLAN.decode(row)
+            kind = FollowEventType.NEW_STARTER if previous is None else FollowEventType.STARTER_UPDATED
+            events.append(FollowEvent(kind, starter.race_number, starter))
@@ -0,0 +1,140 @@
+#! python3
+
+
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from .races import Race
+from .store import RaceKey
+from .textchart import Header, Record, Source, StarterPerformanceData, iter_records
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+FEATURES = (
+    'official_finish',
+    'odds',
+    'speed_index',
+    'length_behind_at_finish',
+    'individual_horse_time',
+)
+
+Entry = tuple[str, RaceKey | None]
+
+
+class HorseStarts:
+    __slots__ = ('keys', 'values')
+
+    def __init__(self) -> None:
+        self.keys: list[RaceKey] = []
+        self.values = array('d')
+
+
+@dataclass
+class FeatureMatrix:
+    entries: list[Entry]
+    features: tuple[str, ...]
+    depth: int
+    values: array
+    counts: array
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        return len(self.entries), self.depth, len(self.features)
+
+    def matrix(self):
+        if numpy is not None:
+            return numpy.frombuffer(self.values, dtype=numpy.float64).reshape(self.shape)
+        width = self.depth * len(self.features)
+        return [self.values[index * width:(index + 1) * width] for index in range(len(self.entries))]
+
+
+class HorseHistory:
+
+    def __init__(self, depth: int = 10, features: tuple[str, ...] = FEATURES, max_horses: int | None = None) -> None:
+        self.depth = depth
+        self.features = features
+        self.max_horses = max_horses
+        self.horses: OrderedDict[str, HorseStarts] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.horses)
+
+    def add_file(self, source: Source) -> None:
+        self.add_chart(iter_records(source))
+
+    def add_chart(self, records: Iterable[Record]) -> None:
+        header: Header | None = None
+        for record in records:
+            if isinstance(record, Header):
+                header = record
+            elif isinstance(record, StarterPerformanceData):
+                self.add_starter(RaceKey(header.race_date, header.track_code, record.race_number), record)
+
+    def add_starter(self, key: RaceKey, starter: StarterPerformanceData) -> None:
+        width = len(self.features)
+        horse = self.horses.get(starter.horse_key)
+        if horse is None:
+            horse = self.horses[starter.horse_key] = HorseStarts()
+            if self.max_horses is not None and len(self.horses) > self.max_horses:
+                self.horses.popitem(last=False)
+        else:
+            self.horses.move_to_end(starter.horse_key)
+        values = array('d', [float(getattr(starter, name)) for name in self.features])
+        position = bisect_left(horse.keys, key)
+        if position < len(horse.keys) and horse.keys[position] == key:
+            horse.values[position * width:(position + 1) * width] = values
+            return
+        if len(horse.keys) == self.depth and position == 0:
+            return
+        horse.keys.insert(position, key)
+        horse.values[position * width:position * width] = values
+        if len(horse.keys) > self.depth:
+            del horse.keys[0]
+            del horse.values[:width]
+
+    def starts(self, horse_key: str) -> list[tuple[RaceKey, tuple[float, ...]]]:
+        horse = self.horses.get(horse_key)
+        if horse is None:
+            return []
+        width = len(self.features)
+        return [
+            (key, tuple(horse.values[index * width:(index + 1) * width])) for index, key in enumerate(horse.keys)
+        ]
+
+    def matrix(self, entries: Iterable[Entry]) -> FeatureMatrix:
+        entries = list(entries)
+        width = len(self.features)
+        row_width = self.depth * width
+        values = array('d', [float('nan')]) * (len(entries) * row_width)
+        counts = array('q', bytes(8 * len(entries)))
+        for row, (horse_key, before) in enumerate(entries):
+            horse = self.horses.get(horse_key)
+            if horse is None:
+                continue
+            end = len(horse.keys) if before is None else bisect_left(horse.keys, before)
+            count = min(end, self.depth)
+            counts[row] = count
+            offset = row * row_width
+            for index in range(count):
+                start = (end - 1 - index) * width
+                values[offset + index * width:offset + (index + 1) * width] = horse.values[start:start + width]
+        return FeatureMatrix(entries, self.features, self.depth, values, counts)
+
+    def horse_matrix(self, horse_keys: Iterable[str], before: RaceKey | None = None) -> FeatureMatrix:
+        return self.matrix((horse_key, before) for horse_key in horse_keys)
+
+    def card_matrix(self, races: Iterable[Race]) -> FeatureMatrix:
+        entries = []
+        for race in races:
+            key = None
+            if race.header is not None:
+                key = RaceKey(race.header.race_date, race.header.track_code, race.race_number)
+            entries += [(starter.horse_key, key) for starter in race.starters]
+        return self.matrix(entries)
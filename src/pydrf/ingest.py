@@ -0,0 +1,48 @@
+#! python3
+
+
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial, reduce
+from os import PathLike
+from typing import TypeVar
+
+from .textchart import Record, iter_records
+from .wire import WireBatch, pack
+
+
+T = TypeVar('T')
+Path = str | PathLike
+
+
+def read_records(path: Path, compact: bool = False) -> list[Record]:
+    return list(iter_records(path, compact=compact))
+
+
+def read_packed(path: Path, compact: bool = False) -> WireBatch:
+    return pack(iter_records(path, compact=compact))
+
+
+def map_files(paths: Iterable[Path], function: Callable[[Path], T] = read_records,
+              workers: int | None = None, chunksize: int = 1) -> Iterator[tuple[Path, T]]:
+    paths = list(paths)
+    if workers == 1:
+        yield from zip(paths, map(function, paths))
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from zip(paths, executor.map(function, paths, chunksize=chunksize))
+
+
+def iter_file_records(paths: Iterable[Path], workers: int | None = None, chunksize: int = 1,
+                      compact: bool = False, packed: bool = False) -> Iterator[Record]:
+    if packed:
+        for _, batch in map_files(paths, partial(read_packed, compact=compact), workers, chunksize):
+            yield from batch.unpack()
+        return
+    for _, records in map_files(paths, partial(read_records, compact=compact), workers, chunksize):
+        yield from records
+
+
+def reduce_files(paths: Iterable[Path], function: Callable[[Path], T], combine: Callable[[T, T], T], initial: T,
+                 workers: int | None = None, chunksize: int = 1) -> T:
+    return reduce(combine, (result for _, result in map_files(paths, function, workers, chunksize)), initial)
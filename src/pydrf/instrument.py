@@ -0,0 +1,136 @@
+#! python3
+
+
+from collections import Counter
+from collections.abc import Iterator
+from time import perf_counter_ns
+
+from .textchart import (COMPACT_PLANS, PLANS, AttendanceAndHandleDataIndex, CommentsAndRaceOdditiesDataIndex,
+                        Converter, DecodePlan, ExoticWageringDataIndex, FootNotesIndex, HeaderIndex, RaceDataIndex,
+                        Record, RecordType, Source, StarterPerformanceDataIndex, iter_rows, record_factories)
+
+
+INDEXES: dict[str, type] = {
+    RecordType.HEADER.value: HeaderIndex,
+    RecordType.RACE.value: RaceDataIndex,
+    RecordType.STARTER.value: StarterPerformanceDataIndex,
+    RecordType.EXOTIC_WAGERING.value: ExoticWageringDataIndex,
+    RecordType.ATTENDANCE.value: AttendanceAndHandleDataIndex,
+    RecordType.COMMENT.value: CommentsAndRaceOdditiesDataIndex,
+    RecordType.FOOTNOTE.value: FootNotesIndex,
+}
+
+TRAILING_RESERVED_COLUMNS: dict[str, int] = {
+    RecordType.ATTENDANCE.value: 2,
+}
+
+ROW_WIDTHS: dict[str, int] = {
+    record_type: max(member.value for member in index) + 1 + TRAILING_RESERVED_COLUMNS.get(record_type, 0)
+    for record_type, index in INDEXES.items()
+}
+
+PARSERS: dict[type, type] = {
+    int: int,
+    float: float,
+}
+
+
+class ParseStats:
+
+    def __init__(self) -> None:
+        self.rows: Counter[str] = Counter()
+        self.nanoseconds: Counter[str] = Counter()
+        self.blanks: Counter[str] = Counter()
+        self.fallbacks: Counter[str] = Counter()
+        self.short_rows: Counter[str] = Counter()
+        self.overlong_rows: Counter[str] = Counter()
+        self.unknown_rows: Counter[str] = Counter()
+
+    def merge(self, other: 'ParseStats') -> 'ParseStats':
+        self.rows.update(other.rows)
+        self.nanoseconds.update(other.nanoseconds)
+        self.blanks.update(other.blanks)
+        self.fallbacks.update(other.fallbacks)
+        self.short_rows.update(other.short_rows)
+        self.overlong_rows.update(other.overlong_rows)
+        self.unknown_rows.update(other.unknown_rows)
+        return self
+
+    def converter(self, key: str, parse: type, converter: Converter) -> Converter:
+        blanks = self.blanks
+        fallbacks = self.fallbacks
+
+        def convert(value: str):
+            if not value.strip():
+                blanks[key] += 1
+            else:
+                try:
+                    parse(value)
+                except ValueError:
+                    fallbacks[key] += 1
+            return converter(value)
+        return convert
+
+    def snapshot(self) -> dict[str, dict]:
+        record_types = {member.value: member.name for member in RecordType}
+        return {
+            'record_types': {
+                record_types.get(record_type, record_type): {
+                    'rows': count,
+                    'seconds': self.nanoseconds[record_type] / 1e9,
+                    'short_rows': self.short_rows[record_type],
+                    'overlong_rows': self.overlong_rows[record_type],
+                }
+                for record_type, count in sorted(self.rows.items())
+            },
+            'blanks': dict(sorted(self.blanks.items())),
+            'fallbacks': dict(sorted(self.fallbacks.items())),
+            'unknown_rows': dict(sorted(self.unknown_rows.items())),
+        }
+
+
+def instrumented_plan(plan: DecodePlan, stats: ParseStats) -> DecodePlan:
+    record_fields = plan.record_class.__dataclass_fields__
+    name = plan.record_class.__name__.removeprefix('Compact')
+    converters = {}
+    for field in plan.fields:
+        parse = PARSERS.get(record_fields[field].type)
+        if parse is not None:
+            converters[field] = stats.converter(f'{name}.{field}', parse, plan.converter(field))
+    return plan.replace(converters)
+
+
+def instrumented_plans(stats: ParseStats, plans: dict[str, DecodePlan] = PLANS) -> dict[str, DecodePlan]:
+    return {record_type: instrumented_plan(plan, stats) for record_type, plan in plans.items()}
+
+
+def iter_instrumented_records(source: Source, stats: ParseStats, encoding: str = 'latin-1', compact: bool = False,
+                              plans: dict[str, DecodePlan] | None = None) -> Iterator[Record]:
+    if plans is None:
+        plans = COMPACT_PLANS if compact else PLANS
+    plans = instrumented_plans(stats, plans)
+    factories = record_factories(plans=plans)
+    required = {record_type: max((column for column, _ in plan.steps), default=0) + 1
+                for record_type, plan in plans.items()}
+    record_type_column = HeaderIndex.RECORD_TYPE_INDEX.value
+    rows, nanoseconds = stats.rows, stats.nanoseconds
+    for row in iter_rows(source, encoding):
+        if not row:
+            continue
+        record_type = row[record_type_column]
+        factory = factories.get(record_type)
+        if factory is None:
+            stats.unknown_rows[record_type] += 1
+            continue
+        width = ROW_WIDTHS.get(record_type, len(row))
+        if len(row) < width:
+            stats.short_rows[record_type] += 1
+            if len(row) < required[record_type]:
+                continue
+        elif len(row) > width:
+            stats.overlong_rows[record_type] += 1
+        start = perf_counter_ns()
+        record = factory(row)
+        nanoseconds[record_type] += perf_counter_ns() - start
+        rows[record_type] += 1
+        yield record
@@ -0,0 +1,76 @@
+#! python3
+
+
+from collections.abc import Iterator
+
+from .textchart import PLANS, Converter, DecodePlan, HeaderIndex, RecordType, Source, iter_rows
+
+
+class LazyField:
+    __slots__ = ('name', 'column', 'converter')
+
+    def __init__(self, name: str, column: int, converter: Converter) -> None:
+        self.name = name
+        self.column = column
+        self.converter = converter
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = self.converter(instance._row[self.column])
+        instance.__dict__[self.name] = value
+        return value
+
+
+class LazyRecord:
+    __slots__ = ()
+    plan: DecodePlan
+
+    def __init__(self, row: list[str]) -> None:
+        self._row = row
+
+    def materialize(self):
+        record_class = self.plan.record_class
+        return record_class(*[getattr(self, name) for name in self.plan.fields])
+
+    def __eq__(self, other) -> bool:
+        if self.__class__ is other.__class__:
+            return self.materialize() == other.materialize()
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self._row!r})'
+
+
+def lazy_class(plan: DecodePlan) -> type:
+    namespace = {
+        '__slots__': ('_row', '__dict__'),
+        'plan': plan,
+    }
+    for name, (column, converter) in zip(plan.fields, plan.steps):
+        namespace[name] = LazyField(name, column, converter)
+    return type(f'Lazy{plan.record_class.__name__}', (LazyRecord,), namespace)
+
+
+LAZY_CLASSES: dict[str, type] = {
+    record_type: lazy_class(plan) for record_type, plan in PLANS.items()
+}
+
+LazyHeader = LAZY_CLASSES[RecordType.HEADER.value]
+LazyRaceData = LAZY_CLASSES[RecordType.RACE.value]
+LazyStarterPerformanceData = LAZY_CLASSES[RecordType.STARTER.value]
+LazyExoticWageringData = LAZY_CLASSES[RecordType.EXOTIC_WAGERING.value]
+LazyAttendanceAndHandleData = LAZY_CLASSES[RecordType.ATTENDANCE.value]
+LazyCommentsAndRaceOdditiesData = LAZY_CLASSES[RecordType.COMMENT.value]
+LazyFootNotes = LAZY_CLASSES[RecordType.FOOTNOTE.value]
+
+
+def iter_lazy_records(source: Source, encoding: str = 'latin-1') -> Iterator[LazyRecord]:
+    classes = LAZY_CLASSES
+    record_type = HeaderIndex.RECORD_TYPE_INDEX.value
+    for row in iter_rows(source, encoding):
+        if not row:
+            continue
+        lazy = classes.get(row[record_type])
+        if lazy is not None:
+            yield lazy(row)
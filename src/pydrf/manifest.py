@@ -0,0 +1,102 @@
+#! python3
+
+
+import hashlib
+import json
+import os
+from collections.abc import Iterable, Iterator
+from os import PathLike
+
+from .races import Race, assemble_races
+from .textchart import DecodePlan, HeaderIndex, RaceDataIndex, RecordType, Source, iter_rows, record_factories
+
+
+FINGERPRINT_TYPES = frozenset({
+    RecordType.RACE.value,
+    RecordType.STARTER.value,
+    RecordType.EXOTIC_WAGERING.value,
+})
+
+ChartRows = tuple[list[str] | None, dict[str, list[list[str]]]]
+
+
+def race_key(track_code: str, race_date: str, race_number: str) -> str:
+    return '/'.join((track_code.strip(), race_date.strip(), race_number.strip()))
+
+
+def race_digest(rows: Iterable[list[str]]) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for row in rows:
+        if row[0] in FINGERPRINT_TYPES:
+            digest.update('\x1f'.join(row).encode())
+            digest.update(b'\x1e')
+    return digest.hexdigest()
+
+
+def iter_chart_rows(rows: Iterable[list[str]]) -> Iterator[ChartRows]:
+    header_type = RecordType.HEADER.value
+    race_number = RaceDataIndex.RACE_NUMBER_INDEX.value
+    header, races = None, {}
+    for row in rows:
+        if not row:
+            continue
+        if row[0] == header_type:
+            if header is not None or races:
+                yield header, races
+            header, races = row, {}
+        elif len(row) > race_number:
+            races.setdefault(row[race_number].strip(), []).append(row)
+    if header is not None or races:
+        yield header, races
+
+
+class RaceManifest:
+
+    def __init__(self, path: str | PathLike | None = None) -> None:
+        self.path = path
+        self.fingerprints: dict[str, str] = {}
+        if path is not None and os.path.exists(path):
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self.fingerprints)
+
+    def load(self) -> None:
+        with open(self.path, encoding='utf-8') as file:
+            self.fingerprints = json.load(file)['races']
+
+    def save(self) -> None:
+        temporary = f'{os.fspath(self.path)}.tmp'
+        with open(temporary, 'w', encoding='utf-8') as file:
+            json.dump({'races': self.fingerprints}, file, sort_keys=True)
+        os.replace(temporary, self.path)
+
+    def is_current(self, key: str, digest: str) -> bool:
+        return self.fingerprints.get(key) == digest
+
+    def update(self, key: str, digest: str) -> None:
+        self.fingerprints[key] = digest
+
+
+def iter_changed_races(source: Source, manifest: RaceManifest, encoding: str = 'latin-1', compact: bool = False,
+                       plans: dict[str, DecodePlan] | None = None) -> Iterator[Race]:
+    factories = record_factories(compact, plans)
+    header_factory = factories.get(RecordType.HEADER.value)
+    track_code, race_date = HeaderIndex.TRACK_CODE_INDEX.value, HeaderIndex.RACE_DATE_INDEX.value
+    try:
+        for header_row, races in iter_chart_rows(iter_rows(source, encoding)):
+            header = None
+            for number, rows in races.items():
+                key = race_key(header_row[track_code], header_row[race_date], number) if header_row else number
+                digest = race_digest(rows)
+                if manifest.is_current(key, digest):
+                    continue
+                if header is None and header_row is not None and header_factory is not None:
+                    header = header_factory(header_row)
+                records = [header] if header is not None else []
+                records += [factories[row[0]](row) for row in rows if row[0] in factories]
+                yield from assemble_races(records)
+                manifest.update(key, digest)
+    finally:
+        if manifest.path is not None:
+            manifest.save()
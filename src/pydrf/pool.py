@@ -0,0 +1,81 @@
+#! python3
+
+
+import sys
+from dataclasses import dataclass
+
+from .textchart import PLANS, Converter, DecodePlan, to_str
+
+
+UNPOOLED_FIELDS = frozenset({
+    'short_comments',
+    'long_comments',
+})
+
+
+@dataclass
+class PoolReport:
+    unique: int
+    references: int
+    saved_bytes: int
+    table_bytes: int
+
+
+class StringPool:
+
+    def __init__(self) -> None:
+        self.codes: dict[str, int] = {}
+        self.values: list[str] = []
+        self.references = 0
+        self.saved_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def encode(self, value: str) -> int:
+        self.references += 1
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        elif len(value) > 1:
+            self.saved_bytes += sys.getsizeof(value)
+        return code
+
+    def intern(self, value: str) -> str:
+        return self.values[self.encode(value)]
+
+    def decode(self, code: int) -> str:
+        return self.values[code]
+
+    def code(self, value: str) -> int | None:
+        return self.codes.get(value)
+
+    def report(self) -> PoolReport:
+        table_bytes = sys.getsizeof(self.codes) + sys.getsizeof(self.values)
+        return PoolReport(len(self.values), self.references, self.saved_bytes, table_bytes)
+
+    def converter(self, converter: Converter = to_str) -> Converter:
+        encode = self.encode
+        values = self.values
+
+        def intern(value: str) -> str:
+            return values[encode(converter(value))]
+        return intern
+
+
+def pooled_fields(plan: DecodePlan) -> tuple[str, ...]:
+    return tuple(
+        name for name in plan.fields
+        if plan.record_class.__dataclass_fields__[name].type is str and name not in UNPOOLED_FIELDS
+    )
+
+
+def pooled_plan(plan: DecodePlan, pool: StringPool, names: tuple[str, ...] | None = None) -> DecodePlan:
+    if names is None:
+        names = pooled_fields(plan)
+    return plan.replace({name: pool.converter(plan.converter(name)) for name in names})
+
+
+def pooled_plans(pool: StringPool, plans: dict[str, DecodePlan] = PLANS) -> dict[str, DecodePlan]:
+    return {record_type: pooled_plan(plan, pool) for record_type, plan in plans.items()}
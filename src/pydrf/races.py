@@ -0,0 +1,69 @@
+#! python3
+
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+
+from .textchart import (COMPACT_PLANS, PLANS, AttendanceAndHandleData, CommentsAndRaceOdditiesData, DecodePlan,
+                        ExoticWageringData, FootNotes, Header, RaceData, Record, RecordType, Source,
+                        StarterPerformanceData, iter_records)
+
+
+@dataclass
+class Race:
+    header: Header | None
+    race_number: int
+    race: RaceData | None = None
+    starters: list[StarterPerformanceData] = field(default_factory=list)
+    exotic_wagering: list[ExoticWageringData] = field(default_factory=list)
+    attendance: list[AttendanceAndHandleData] = field(default_factory=list)
+    comments: list[CommentsAndRaceOdditiesData] = field(default_factory=list)
+    foot_notes: list[FootNotes] = field(default_factory=list)
+
+
+CHILDREN: dict[str, str] = {
+    RecordType.STARTER.value: 'starters',
+    RecordType.EXOTIC_WAGERING.value: 'exotic_wagering',
+    RecordType.ATTENDANCE.value: 'attendance',
+    RecordType.COMMENT.value: 'comments',
+    RecordType.FOOTNOTE.value: 'foot_notes',
+}
+
+RECORD_TYPES: dict[type, str] = {
+    plan.record_class: record_type for plans in (PLANS, COMPACT_PLANS) for record_type, plan in plans.items()
+}
+
+
+def assemble_races(records: Iterable[Record]) -> Iterator[Race]:
+    header = None
+    current: Race | None = None
+    pending: dict[int, Race] = {}
+    for record in records:
+        record_type = RECORD_TYPES.get(type(record))
+        if record_type == RecordType.HEADER.value:
+            if current is not None:
+                yield current
+            yield from (pending[number] for number in sorted(pending))
+            header, current, pending = record, None, {}
+        elif record_type == RecordType.RACE.value:
+            if current is not None:
+                yield current
+            current = pending.pop(record.race_number, None) or Race(header, record.race_number)
+            current.race = record
+        elif record_type in CHILDREN:
+            number = record.race_number
+            if current is not None and current.race_number == number:
+                target = current
+            else:
+                target = pending.get(number)
+                if target is None:
+                    target = pending[number] = Race(header, number)
+            getattr(target, CHILDREN[record_type]).append(record)
+    if current is not None:
+        yield current
+    yield from (pending[number] for number in sorted(pending))
+
+
+def iter_races(source: Source, encoding: str = 'latin-1', compact: bool = False,
+               plans: dict[str, DecodePlan] | None = None) -> Iterator[Race]:
+    return assemble_races(iter_records(source, encoding, compact, plans))
@@ -0,0 +1,141 @@
+#! python3
+
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from math import isnan, trunc
+
+from .textchart import RaceDataIndex, RecordType, StarterPerformanceDataIndex, to_float, to_int, to_str
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+SECONDS_PER_LENGTH = 0.2
+
+Matrix = list[list[float]]
+
+FRACTION_COLUMNS = (
+    RaceDataIndex.FRACTION1_INDEX.value,
+    RaceDataIndex.FRACTION2_INDEX.value,
+    RaceDataIndex.FRACTION3_INDEX.value,
+    RaceDataIndex.FRACTION4_INDEX.value,
+    RaceDataIndex.FRACTION5_INDEX.value,
+)
+
+BEHIND_COLUMNS = (
+    StarterPerformanceDataIndex.LENGTH_BEHIND_AT_POC1_INDEX.value,
+    StarterPerformanceDataIndex.LENGTH_BEHIND_AT_POC2_INDEX.value,
+    StarterPerformanceDataIndex.LENGTH_BEHIND_AT_POC3_INDEX.value,
+    StarterPerformanceDataIndex.LENGTH_BEHIND_AT_POC4_INDEX.value,
+    StarterPerformanceDataIndex.LENGTH_BEHIND_AT_POC5_INDEX.value,
+    StarterPerformanceDataIndex.LENGTH_BEHIND_AT_FINISH_INDEX.value,
+)
+
+
+def round_hundredths(value: float) -> float:
+    if isnan(value):
+        return value
+    return round(value * 100) / 100
+
+
+def fraction_seconds(value: float) -> float:
+    if isnan(value):
+        return value
+    minutes = float(trunc(value / 10000))
+    return round_hundredths(minutes * 60 + value / 100 - minutes * 100)
+
+
+def final_time_seconds(value: float) -> float:
+    if isnan(value):
+        return value
+    minutes = float(trunc(value / 100))
+    return round_hundredths(minutes * 60 + value - minutes * 100)
+
+
+def fractions_to_seconds(values: Sequence[float], use_numpy: bool = True):
+    if numpy is not None and use_numpy:
+        values = numpy.asarray(values, dtype=numpy.float64)
+        minutes = numpy.trunc(values / 10000)
+        return numpy.round(minutes * 60 + values / 100 - minutes * 100, 2)
+    return [fraction_seconds(value) for value in values]
+
+
+def final_times_to_seconds(values: Sequence[float], use_numpy: bool = True):
+    if numpy is not None and use_numpy:
+        values = numpy.asarray(values, dtype=numpy.float64)
+        minutes = numpy.trunc(values / 100)
+        return numpy.round(minutes * 60 + values - minutes * 100, 2)
+    return [final_time_seconds(value) for value in values]
+
+
+def race_times(fractions: Sequence[Sequence[float]], final_times: Sequence[float], use_numpy: bool = True):
+    columns = [
+        fractions_to_seconds([row[call] for row in fractions], use_numpy) for call in range(len(FRACTION_COLUMNS))
+    ]
+    columns.append(final_times_to_seconds(final_times, use_numpy))
+    if numpy is not None and use_numpy:
+        return numpy.column_stack(columns) if len(final_times) else numpy.empty((0, len(columns)))
+    return [list(row) for row in zip(*columns)]
+
+
+def split_times(times, race_index: Sequence[int], behind: Sequence[Sequence[float]],
+                seconds_per_length: float = SECONDS_PER_LENGTH, use_numpy: bool = True):
+    if numpy is not None and use_numpy:
+        times = numpy.asarray(times, dtype=numpy.float64)
+        behind = numpy.asarray(behind, dtype=numpy.float64)
+        if not len(race_index):
+            return numpy.empty((0, times.shape[1] if times.ndim == 2 else len(BEHIND_COLUMNS)))
+        return times[numpy.asarray(race_index, dtype=numpy.intp)] + behind * seconds_per_length
+    return [
+        [time + lengths * seconds_per_length for time, lengths in zip(times[race], row)]
+        for race, row in zip(race_index, behind)
+    ]
+
+
+@dataclass
+class SplitTimes:
+    races: list[tuple[int, int]]
+    race_times: 'Matrix | numpy.ndarray'
+    starters: list[tuple[int, int, str]]
+    race_index: list[int]
+    starter_times: 'Matrix | numpy.ndarray'
+
+
+def card_split_times(rows: Iterable[list[str]], seconds_per_length: float = SECONDS_PER_LENGTH,
+                     use_numpy: bool = True) -> SplitTimes:
+    header, race, starter = RecordType.HEADER.value, RecordType.RACE.value, RecordType.STARTER.value
+    final_column = RaceDataIndex.FINAL_TIME_INDEX.value
+    race_number_column = RaceDataIndex.RACE_NUMBER_INDEX.value
+    horse_key_column = StarterPerformanceDataIndex.HORSE_KEY_INDEX.value
+    chart = -1
+    races: dict[tuple[int, int], int] = {}
+    fractions, final_times, starters, race_index, behind = [], [], [], [], []
+    for row in rows:
+        if not row:
+            continue
+        record_type = row[0]
+        if record_type == header:
+            chart += 1
+        elif record_type == race:
+            races[(chart, to_int(row[race_number_column]))] = len(final_times)
+            fractions.append([to_float(row[column]) for column in FRACTION_COLUMNS])
+            final_times.append(to_float(row[final_column]))
+        elif record_type == starter:
+            race_number = to_int(row[race_number_column])
+            index = races.get((chart, race_number))
+            if index is None:
+                continue
+            starters.append((chart, race_number, to_str(row[horse_key_column])))
+            race_index.append(index)
+            behind.append([to_float(row[column]) for column in BEHIND_COLUMNS])
+    times = race_times(fractions, final_times, use_numpy)
+    return SplitTimes(
+        list(races),
+        times,
+        starters,
+        race_index,
+        split_times(times, race_index, behind, seconds_per_length, use_numpy)
+    )
@@ -0,0 +1,217 @@
+#! python3
+
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass, fields
+from math import isnan
+
+from .ingest import Path, reduce_files
+from .store import RaceKey
+from .textchart import Header, Record, Source, StarterPerformanceData, iter_records
+
+
+WAGER = 2.0
+
+
+def owner_key(starter: StarterPerformanceData) -> str:
+    return ' '.join(name for name in (starter.owner_first_name, starter.owner_middle_name, starter.owner_last_name)
+                    if name)
+
+
+ROLES: dict[str, Callable[[StarterPerformanceData], Hashable]] = {
+    'jockey': lambda starter: starter.jockey_key,
+    'trainer': lambda starter: starter.trainer_key,
+    'owner': owner_key,
+}
+
+
+def payoff(value: float) -> float:
+    return 0.0 if isnan(value) else value
+
+
+@dataclass(slots=True)
+class Tally:
+    starts: int = 0
+    wins: int = 0
+    in_the_money: int = 0
+    win_return: float = 0.0
+    place_return: float = 0.0
+    show_return: float = 0.0
+
+    @staticmethod
+    def create(starter: StarterPerformanceData) -> 'Tally':
+        return Tally(
+            1,
+            int(starter.official_finish == 1),
+            int(1 <= starter.official_finish <= 3),
+            payoff(starter.win_payoff),
+            payoff(starter.place_payoff),
+            payoff(starter.show_payoff)
+        )
+
+    def add(self, other: 'Tally') -> 'Tally':
+        self.starts += other.starts
+        self.wins += other.wins
+        self.in_the_money += other.in_the_money
+        self.win_return += other.win_return
+        self.place_return += other.place_return
+        self.show_return += other.show_return
+        return self
+
+    def subtract(self, other: 'Tally') -> 'Tally':
+        self.starts -= other.starts
+        self.wins -= other.wins
+        self.in_the_money -= other.in_the_money
+        self.win_return -= other.win_return
+        self.place_return -= other.place_return
+        self.show_return -= other.show_return
+        return self
+
+    def copy(self) -> 'Tally':
+        return Tally(*(getattr(self, field.name) for field in fields(self)))
+
+    def roi(self, returned: float) -> float:
+        if not self.starts:
+            return float('nan')
+        wagered = WAGER * self.starts
+        return (returned - wagered) / wagered
+
+    @property
+    def win_percent(self) -> float:
+        return 100 * self.wins / self.starts if self.starts else float('nan')
+
+    @property
+    def in_the_money_percent(self) -> float:
+        return 100 * self.in_the_money / self.starts if self.starts else float('nan')
+
+    @property
+    def win_roi(self) -> float:
+        return self.roi(self.win_return)
+
+    @property
+    def place_roi(self) -> float:
+        return self.roi(self.place_return)
+
+    @property
+    def show_roi(self) -> float:
+        return self.roi(self.show_return)
+
+
+class DailyTallies:
+    __slots__ = ('dates', 'tallies')
+
+    def __init__(self) -> None:
+        self.dates: list[str] = []
+        self.tallies: dict[str, Tally] = {}
+
+    def add(self, race_date: str, tally: Tally) -> None:
+        current = self.tallies.get(race_date)
+        if current is None:
+            insort(self.dates, race_date)
+            self.tallies[race_date] = tally.copy()
+        else:
+            current.add(tally)
+
+    def subtract(self, race_date: str, tally: Tally) -> None:
+        current = self.tallies[race_date].subtract(tally)
+        if not current.starts:
+            del self.tallies[race_date]
+            del self.dates[bisect_left(self.dates, race_date)]
+
+    def total(self, start_date: str | None = None, end_date: str | None = None) -> Tally:
+        low = 0 if start_date is None else bisect_left(self.dates, start_date)
+        high = len(self.dates) if end_date is None else bisect_right(self.dates, end_date)
+        total = Tally()
+        for race_date in self.dates[low:high]:
+            total.add(self.tallies[race_date])
+        return total
+
+
+class ConnectionStats:
+
+    def __init__(self) -> None:
+        self.races: dict[RaceKey, dict[tuple[str, Hashable], Tally]] = {}
+        self.roles: dict[str, dict[Hashable, DailyTallies]] = {role: {} for role in ROLES}
+
+    def add_file(self, source: Source) -> None:
+        self.add_chart(iter_records(source))
+
+    def add_chart(self, records: Iterable[Record]) -> None:
+        header: Header | None = None
+        added: set[RaceKey] = set()
+        for record in records:
+            if isinstance(record, Header):
+                header = record
+                added.clear()
+            elif isinstance(record, StarterPerformanceData):
+                key = RaceKey(header.race_date, header.track_code, record.race_number)
+                if key not in added:
+                    self.remove_race(key)
+                    added.add(key)
+                self.add_starter(key, record)
+
+    def add_starter(self, key: RaceKey, starter: StarterPerformanceData) -> None:
+        tally = Tally.create(starter)
+        contributions = self.races.setdefault(key, {})
+        for role, key_of in ROLES.items():
+            value = key_of(starter)
+            daily = self.roles[role].get(value)
+            if daily is None:
+                daily = self.roles[role][value] = DailyTallies()
+            daily.add(key.race_date, tally)
+            contribution = contributions.get((role, value))
+            if contribution is None:
+                contributions[(role, value)] = tally.copy()
+            else:
+                contribution.add(tally)
+
+    def remove_race(self, key: RaceKey) -> None:
+        contributions = self.races.pop(key, None)
+        if contributions is None:
+            return
+        for (role, value), tally in contributions.items():
+            daily = self.roles[role][value]
+            daily.subtract(key.race_date, tally)
+            if not daily.dates:
+                del self.roles[role][value]
+
+    def merge(self, other: 'ConnectionStats') -> 'ConnectionStats':
+        for key in other.races.keys() & self.races.keys():
+            self.remove_race(key)
+        for key, contributions in other.races.items():
+            self.races[key] = {value: tally.copy() for value, tally in contributions.items()}
+        for role, keys in other.roles.items():
+            mine = self.roles[role]
+            for value, daily in keys.items():
+                target = mine.get(value)
+                if target is None:
+                    target = mine[value] = DailyTallies()
+                for race_date in daily.dates:
+                    target.add(race_date, daily.tallies[race_date])
+        return self
+
+    def keys(self, role: str) -> list[Hashable]:
+        return list(self.roles[role])
+
+    def query(self, role: str, value: Hashable, start_date: str | None = None,
+              end_date: str | None = None) -> Tally:
+        daily = self.roles[role].get(value)
+        return Tally() if daily is None else daily.total(start_date, end_date)
+
+    def leaders(self, role: str, start_date: str | None = None, end_date: str | None = None,
+                minimum_starts: int = 1, by: str = 'win_percent') -> list[tuple[Hashable, Tally]]:
+        totals = [(value, daily.total(start_date, end_date)) for value, daily in self.roles[role].items()]
+        totals = [(value, tally) for value, tally in totals if tally.starts >= minimum_starts]
+        return sorted(totals, key=lambda item: getattr(item[1], by), reverse=True)
+
+
+def file_stats(path: Path) -> ConnectionStats:
+    stats = ConnectionStats()
+    stats.add_file(path)
+    return stats
+
+
+def collect_stats(paths: Iterable[Path], workers: int | None = None, chunksize: int = 1) -> ConnectionStats:
+    # merge keeps the later partial's copy of a race, so this relies on reduce_files folding results in path order.
+    return reduce_files(paths, file_stats, ConnectionStats.merge, ConnectionStats(), workers, chunksize)
@@ -0,0 +1,106 @@
+#! python3
+
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from .textchart import Header, RaceData, Record, Source, StarterPerformanceData, iter_records
+
+
+@dataclass(frozen=True, order=True)
+class RaceKey:
+    race_date: str
+    track_code: str
+    race_number: int
+
+
+@dataclass(frozen=True, eq=False)
+class Start:
+    key: RaceKey
+    starter: StarterPerformanceData
+
+
+class ChartStore:
+
+    def __init__(self) -> None:
+        self.races: dict[RaceKey, RaceData] = {}
+        self.starters: dict[RaceKey, list[Start]] = {}
+        self.dates: list[RaceKey] = []
+        self.horses: dict[str, list[Start]] = {}
+        self.jockeys: dict[int, list[Start]] = {}
+        self.trainers: dict[int, list[Start]] = {}
+
+    def __len__(self) -> int:
+        return len(self.races)
+
+    def add_file(self, source: Source) -> None:
+        self.add_chart(iter_records(source))
+
+    def add_chart(self, records: Iterable[Record]) -> None:
+        header: Header | None = None
+        for record in records:
+            if isinstance(record, Header):
+                header = record
+            elif isinstance(record, RaceData):
+                self.add_race(RaceKey(header.race_date, header.track_code, record.race_number), record)
+            elif isinstance(record, StarterPerformanceData):
+                self.add_starter(RaceKey(header.race_date, header.track_code, record.race_number), record)
+
+    def add_race(self, key: RaceKey, race: RaceData) -> None:
+        if key in self.races:
+            self.remove_race(key)
+        self.races[key] = race
+        self.starters[key] = []
+        insort(self.dates, key)
+
+    def add_starter(self, key: RaceKey, starter: StarterPerformanceData) -> None:
+        start = Start(key, starter)
+        self.starters.setdefault(key, []).append(start)
+        for index, value in ((self.horses, starter.horse_key),
+                             (self.jockeys, starter.jockey_key),
+                             (self.trainers, starter.trainer_key)):
+            insort(index.setdefault(value, []), start, key=self.start_key)
+
+    def remove_race(self, key: RaceKey) -> None:
+        self.races.pop(key, None)
+        starts = self.starters.pop(key, [])
+        position = bisect_left(self.dates, key)
+        if position < len(self.dates) and self.dates[position] == key:
+            del self.dates[position]
+        for start in starts:
+            for index, value in ((self.horses, start.starter.horse_key),
+                                 (self.jockeys, start.starter.jockey_key),
+                                 (self.trainers, start.starter.trainer_key)):
+                entries = index[value]
+                entries.remove(start)
+                if not entries:
+                    del index[value]
+
+    @staticmethod
+    def start_key(start: Start) -> RaceKey:
+        return start.key
+
+    def race(self, track_code: str, race_date: str, race_number: int) -> RaceData | None:
+        return self.races.get(RaceKey(race_date, track_code, race_number))
+
+    def race_starters(self, track_code: str, race_date: str, race_number: int) -> list[StarterPerformanceData]:
+        return [start.starter for start in self.starters.get(RaceKey(race_date, track_code, race_number), [])]
+
+    def horse(self, horse_key: str) -> list[Start]:
+        return list(self.horses.get(horse_key, []))
+
+    def jockey(self, jockey_key: int) -> list[Start]:
+        return list(self.jockeys.get(jockey_key, []))
+
+    def trainer(self, trainer_key: int) -> list[Start]:
+        return list(self.trainers.get(trainer_key, []))
+
+    def races_between(self, start_date: str, end_date: str) -> list[RaceKey]:
+        low = bisect_left(self.dates, start_date, key=self.date_of)
+        high = bisect_right(self.dates, end_date, key=self.date_of)
+        return self.dates[low:high]
+
+    @staticmethod
+    def date_of(key: RaceKey) -> str:
+        return key.race_date
@@ -0,0 +1,249 @@
+#! python3
+
+
+import csv
+import random
+from collections.abc import Iterator
+from datetime import date, timedelta
+from typing import IO
+
+from .textchart import (AttendanceAndHandleDataIndex, CommentsAndRaceOdditiesDataIndex, ExoticWageringDataIndex,
+                        FootNotesIndex, HeaderIndex, RaceDataIndex, StarterPerformanceDataIndex)
+
+
+TRACKS = ('AQU', 'BEL', 'CD', 'DMR', 'GP', 'KEE', 'OP', 'PRX', 'SA', 'SAR', 'TAM', 'WO')
+SYLLABLES = ('al', 'ba', 'cor', 'da', 'el', 'fan', 'gar', 'ha', 'ix', 'jo', 'ka', 'lu', 'mor', 'na', 'or',
+             'pi', 'qua', 'ro', 'sil', 'ta', 'ul', 'vin', 'wo', 'xe', 'yo', 'zan')
+RACE_TYPES = ('CLM', 'MCL', 'MSW', 'ALW', 'AOC', 'STK', 'SOC', 'STR')
+WAGER_TYPES = ('EX', 'TRI', 'SUP', 'DD', 'P3', 'P4')
+CONDITIONS = {'D': ('FT', 'GD', 'MY', 'SY', 'WF'), 'T': ('FM', 'GD', 'YL', 'SF')}
+COMMENTS = ('bobbled start', 'stalked pace', 'drew clear', 'steadied', 'rallied wide', 'no late bid',
+            'tired', 'between foes', 'saved ground', 'bumped early', 'gamely', 'checked')
+
+
+def name(generator: random.Random, syllables: int) -> str:
+    return ''.join(generator.choice(SYLLABLES) for _ in range(syllables)).title()
+
+
+class ChartGenerator:
+
+    def __init__(self, seed: int = 0, people: int = 400, horses: int = 5000) -> None:
+        self.random = random.Random(seed)
+        self.jockeys = [(1000 + key, name(self.random, 2), name(self.random, 2)) for key in range(people // 4)]
+        self.trainers = [(5000 + key, name(self.random, 2), name(self.random, 2)) for key in range(people // 2)]
+        self.owners = [(name(self.random, 3), name(self.random, 2)) for _ in range(people)]
+        self.sires = [name(self.random, 3) for _ in range(people // 4)]
+        self.horses = [(str(100000 + key), name(self.random, self.random.randint(2, 5))) for key in range(horses)]
+
+    def chart(self, track_code: str, race_date: str, number_of_races: int | None = None) -> list[list]:
+        rand = self.random
+        number_of_races = number_of_races or rand.randint(8, 12)
+        header = [''] * len(HeaderIndex)
+        header[HeaderIndex.RECORD_TYPE_INDEX.value] = 'H'
+        header[HeaderIndex.COUNTRY_CODE_INDEX.value] = 'USA'
+        header[HeaderIndex.TRACK_CODE_INDEX.value] = track_code
+        header[HeaderIndex.RACE_DATE_INDEX.value] = race_date
+        header[HeaderIndex.NUMBER_OF_RACES_INDEX.value] = number_of_races
+        header[HeaderIndex.DAY_EVENING_FLAG_INDEX.value] = rand.choice('DDDE')
+        header[HeaderIndex.SENDING_TRACK_INDEX.value] = track_code
+        rows = [header]
+        for race_number in range(1, number_of_races + 1):
+            rows += self.race(track_code, race_date, race_number)
+        return rows
+
+    def race(self, track_code: str, race_date: str, race_number: int) -> list[list]:
+        rand = self.random
+        starters = rand.randint(5, 14)
+        surface = rand.choice('DDDT')
+        furlongs = rand.choice((5, 5.5, 6, 6.5, 7, 8, 8.5, 9, 10))
+        final_seconds = round(furlongs * 12.1 + rand.uniform(-2, 4), 2)
+        calls = 3 if furlongs < 8 else 4
+        race = [''] * (RaceDataIndex.OFFICIAL_INDICATOR_INDEX.value + 1)
+        race[RaceDataIndex.RECORD_TYPE_INDEX.value] = 'R'
+        race[RaceDataIndex.RACE_NUMBER_INDEX.value] = race_number
+        race[RaceDataIndex.BREED_INDICATOR_INDEX.value] = 'TB' if rand.random() < 0.95 else 'QH'
+        race[RaceDataIndex.RACE_TYPE_INDEX.value] = rand.choice(RACE_TYPES)
+        race[RaceDataIndex.RESTRICTIONS_INDEX.value] = rand.choice(('', '', '', 'S', 'R'))
+        race[RaceDataIndex.SEX_RESTRICTION_INDEX.value] = rand.choice(('', '', 'B', 'A'))
+        race[RaceDataIndex.AGE_RESTRICTION_INDEX.value] = rand.choice(('02', '03', '3U', '4U'))
+        race[RaceDataIndex.PURSE_USA_INDEX.value] = rand.randrange(10000, 500000, 1000)
+        race[RaceDataIndex.ADDED_MONEY_INDEX.value] = 0
+        race[RaceDataIndex.MINIMUM_CLAIMING_PRICE_USA_INDEX.value] = rand.randrange(0, 80000, 2500)
+        race[RaceDataIndex.MAXIMUM_CLAIMING_PRICE_USA_INDEX.value] = (
+            race[RaceDataIndex.MINIMUM_CLAIMING_PRICE_USA_INDEX.value])
+        race[RaceDataIndex.DISTANCE_INDEX.value] = int(furlongs * 100)
+        race[RaceDataIndex.DISTANCE_UNIT_INDEX.value] = 'F'
+        race[RaceDataIndex.SURFACE_INDEX.value] = surface
+        race[RaceDataIndex.COURSE_TYPE_INDEX.value] = surface if rand.random() < 0.8 else rand.choice('IO')
+        race[RaceDataIndex.NUMBER_OF_HORSES_INDEX.value] = starters
+        race[RaceDataIndex.RACE_NAME_INDEX.value] = f'{name(rand, 3)} Stakes' if rand.random() < 0.1 else ''
+        race[RaceDataIndex.ABBREVIATED_RACE_NAME_INDEX.value] = race[RaceDataIndex.RACE_TYPE_INDEX.value]
+        race[RaceDataIndex.POST_TIME_INDEX.value] = f'{race_number % 12 + 1}:{rand.randrange(0, 60, 5):02d}'
+        race[RaceDataIndex.OFF_TIME_FOR_THIS_RACE_INDEX.value] = race[RaceDataIndex.POST_TIME_INDEX.value]
+        race[RaceDataIndex.TRACK_CONDITION_INDEX.value] = rand.choice(CONDITIONS[surface])
+        race[RaceDataIndex.TRACK_VARIANT_INDEX.value] = rand.randint(5, 25)
+        race[RaceDataIndex.DRF_SPEED_NUMBER_INDEX.value] = rand.randint(60, 110)
+        race[RaceDataIndex.WIND_SPEED_INDEX.value] = rand.randint(0, 20)
+        race[RaceDataIndex.WIND_DIRECTION_INDEX.value] = rand.choice('HTC')
+        race[RaceDataIndex.RACE_TEMPERATURE_INDEX.value] = rand.randint(30, 95)
+        race[RaceDataIndex.FINAL_TIME_INDEX.value] = self.final_time(final_seconds)
+        for call in range(calls):
+            seconds = final_seconds * (call + 1) / (calls + 1) + rand.uniform(-0.5, 0.5)
+            race[RaceDataIndex.FRACTION1_INDEX.value + call] = self.fraction(seconds)
+        race[RaceDataIndex.TIMER_TYPE_INDEX.value] = 'E'
+        race[RaceDataIndex.WPS_POOL_INDEX.value] = rand.randrange(50000, 2000000)
+        race[RaceDataIndex.START_DESCRIPTION_INDEX.value] = 'good'
+        race[RaceDataIndex.WEATHER_INDEX.value] = rand.choice('CCCLRO')
+        race[RaceDataIndex.OFFICIAL_INDICATOR_INDEX.value] = 'Y'
+        rows = [race]
+
+        finish = list(range(1, starters + 1))
+        rand.shuffle(finish)
+        behind = {1: 0.0}
+        for position in range(2, starters + 1):
+            behind[position] = round(behind[position - 1] + rand.choice((0.05, 0.25, 0.5, 1, 1.5, 2, 3, 5)), 2)
+        horses = rand.sample(self.horses, starters)
+        jockeys = rand.sample(self.jockeys, starters)
+        for post, position in enumerate(finish, 1):
+            rows.append(self.starter(race_number, post, position, behind, calls, horses[post - 1], jockeys[post - 1]))
+
+        for wager in rand.sample(WAGER_TYPES, rand.randint(1, 4)):
+            exotic = [''] * len(ExoticWageringDataIndex)
+            exotic[ExoticWageringDataIndex.RECORD_TYPE_INDEX.value] = 'E'
+            exotic[ExoticWageringDataIndex.RACE_NUMBER_INDEX.value] = race_number
+            exotic[ExoticWageringDataIndex.WAGER_TYPE_INDEX.value] = wager
+            exotic[ExoticWageringDataIndex.WAGERING_INDEX.value] = rand.choice((1, 2))
+            exotic[ExoticWageringDataIndex.WINNING_INDEX.value] = '-'.join(
+                str(finish.index(position) + 1) for position in range(1, min(4, starters) + 1))
+            exotic[ExoticWageringDataIndex.MINIMUM_INDEX.value] = rand.choice((1, 2))
+            exotic[ExoticWageringDataIndex.POOL_TOTAL_INDEX.value] = round(rand.uniform(5000, 900000), 2)
+            exotic[ExoticWageringDataIndex.PAYOFF_AMOUNT_INDEX.value] = round(rand.uniform(5, 5000), 2)
+            exotic[ExoticWageringDataIndex.CARRYOVER_INDEX.value] = 0
+            rows.append(exotic)
+
+        attendance = [''] * (AttendanceAndHandleDataIndex.HANDLE_INDEX.value + 3)
+        attendance[AttendanceAndHandleDataIndex.RECORD_TYPE_INDEX.value] = 'A'
+        attendance[AttendanceAndHandleDataIndex.RACE_NUMBER_INDEX.value] = race_number
+        attendance[AttendanceAndHandleDataIndex.LOCATION_TYPE_INDEX.value] = 'T'
+        attendance[AttendanceAndHandleDataIndex.LOCATION_INDEX.value] = track_code
+        attendance[AttendanceAndHandleDataIndex.ATTENDANCE_INDEX.value] = rand.randint(1000, 40000)
+        attendance[AttendanceAndHandleDataIndex.HANDLE_INDEX.value] = round(rand.uniform(1e5, 5e6), 2)
+        rows.append(attendance)
+
+        if rand.random() < 0.15:
+            comment = [''] * len(CommentsAndRaceOdditiesDataIndex)
+            comment[CommentsAndRaceOdditiesDataIndex.RECORD_TYPE_INDEX.value] = 'C'
+            comment[CommentsAndRaceOdditiesDataIndex.RACE_NUMBER_INDEX.value] = race_number
+            comment[CommentsAndRaceOdditiesDataIndex.RESULT_COUNTRY_CODE_INDEX.value] = 'USA'
+            comment[CommentsAndRaceOdditiesDataIndex.TRACK_CODE_INDEX.value] = track_code
+            comment[CommentsAndRaceOdditiesDataIndex.RACE_DATE_INDEX.value] = race_date
+            comment[CommentsAndRaceOdditiesDataIndex.RESULT_RACE_NUMBER_INDEX.value] = race_number
+            comment[CommentsAndRaceOdditiesDataIndex.RESULT_DAY_EVENING_FLAG_INDEX.value] = 'D'
+            comment[CommentsAndRaceOdditiesDataIndex.COMMENT_TYPE_INDEX.value] = rand.choice('GSC')
+            comment[CommentsAndRaceOdditiesDataIndex.COMMENT_TEXT_INDEX.value] = (
+                f'{name(rand, 3)} claimed by {name(rand, 2)}')
+            rows.append(comment)
+
+        for sequence in range(1, rand.randint(1, 3) + 1):
+            note = [''] * len(FootNotesIndex)
+            note[FootNotesIndex.RECORD_TYPE_INDEX.value] = 'F'
+            note[FootNotesIndex.RACE_NUMBER_INDEX.value] = race_number
+            note[FootNotesIndex.FOOT_NOTE_SEQUENCE_NUMBER_INDEX.value] = sequence
+            note[FootNotesIndex.FOOT_NOTE_TEXT_INDEX.value] = ', '.join(rand.sample(COMMENTS, 4)).upper()
+            rows.append(note)
+        return rows
+
+    def starter(self, race_number: int, post: int, position: int, behind: dict[int, float], calls: int,
+                horse: tuple[str, str], jockey: tuple[int, str, str]) -> list:
+        rand = self.random
+        index = StarterPerformanceDataIndex
+        horse_key, horse_name = horse
+        trainer = rand.choice(self.trainers)
+        owner = rand.choice(self.owners)
+        row = [''] * len(index)
+        row[index.RECORD_TYPE_INDEX.value] = 'S'
+        row[index.RACE_NUMBER_INDEX.value] = race_number
+        row[index.HORSE_KEY_INDEX.value] = horse_key
+        row[index.HORSE_NAME_INDEX.value] = horse_name
+        row[index.HORSE_FOALING_DATE_INDEX.value] = (
+            f'20{rand.randint(15, 22)}{rand.randint(1, 6):02d}{rand.randint(1, 28):02d}')
+        row[index.AREA_FOALED_INDEX.value] = rand.choice(('KY', 'KY', 'FL', 'NY', 'CA', 'ON', 'IRE'))
+        row[index.BREED_OF_HORSE_INDEX.value] = 'TB'
+        row[index.SEX_OF_HORSE_INDEX.value] = rand.choice('CFGMHR')
+        row[index.COLOR_INDEX.value] = rand.choice(('B', 'DKB', 'CH', 'GR', 'RO'))
+        for name_column, year_column, breed_column in (
+                (index.DAMS_NAME_INDEX, index.DAMS_YEAR_OF_BIRTH_INDEX, index.DAMS_BREED_TYPE_INDEX),
+                (index.SIRES_NAME_INDEX, index.SIRES_YEAR_OF_BIRTH_INDEX, index.SIRES_BREED_TYPE_INDEX),
+                (index.BROODMARES_SIRES_NAME_INDEX, index.BROODMARES_SIRES_YEAR_OF_BIRTH_INDEX,
+                 index.BROODMARES_SIRES_BREED_TYPE_INDEX),
+                (index.SIRES_SIRES_NAME_INDEX, index.SIRES_SIRES_YEAR_OF_BIRTH_INDEX,
+                 index.SIRES_SIRES_BREED_TYPE_INDEX)):
+            row[name_column.value] = rand.choice(self.sires)
+            row[year_column.value] = str(rand.randint(1995, 2015))
+            row[breed_column.value] = 'TB'
+        row[index.WEIGHT_CARRIED_INDEX.value] = rand.randint(112, 126)
+        row[index.HORSE_WEIGHT_INDEX.value] = ''
+        row[index.MEDICATIONS_INDEX.value] = rand.choice(('L', 'L', 'LB', ''))
+        row[index.EQUIPMENT_INDEX.value] = rand.choice(('b', 'f', 'bf', ''))
+        row[index.EARNINGS_USA_INDEX.value] = rand.randrange(0, 100000)
+        row[index.JOCKEYS_LAST_NAME_INDEX.value] = jockey[1]
+        row[index.JOCKEYS_FIRST_NAME_INDEX.value] = jockey[2]
+        row[index.TRAINERS_LAST_NAME_INDEX.value] = trainer[1]
+        row[index.TRAINERS_FIRST_NAME_INDEX.value] = trainer[2]
+        row[index.OWNERS_LAST_NAME_INDEX.value] = owner[0]
+        row[index.OWNERS_FIRST_NAME_INDEX.value] = owner[1]
+        row[index.ODDS_INDEX.value] = round(rand.lognormvariate(1.6, 0.9), 2)
+        row[index.FAVORITE_INDICATOR_INDEX.value] = '*' if post == 1 else ''
+        row[index.POST_POSITION_INDEX.value] = post
+        row[index.PROGRAM_NUMBER_INDEX.value] = str(post)
+        row[index.POSITION_AT_START_INDEX.value] = rand.randint(1, len(behind))
+        for call in range(calls):
+            row[index.POSITION_AT_POC1_INDEX.value + call] = max(1, position + rand.randint(-2, 2))
+            row[index.LENGTH_AHEAD_AT_POC1_INDEX.value + call] = rand.choice(('', 0.5, 1, 2))
+            row[index.LENGTH_BEHIND_AT_POC1_INDEX.value + call] = round(behind[position] * rand.uniform(0.3, 1.2), 2)
+        row[index.ORIGINAL_FINISH_INDEX.value] = position
+        row[index.OFFICIAL_FINISH_INDEX.value] = position
+        row[index.LENGTH_AHEAD_AT_FINISH_INDEX.value] = rand.choice((0.5, 1, 2)) if position == 1 else ''
+        row[index.LENGTH_BEHIND_AT_FINISH_INDEX.value] = behind[position]
+        row[index.INDIVIDUAL_HORSE_CLAIMING_PRICE_INDEX.value] = rand.choice(('', 25000, 40000))
+        row[index.SHORT_COMMENTS_INDEX.value] = rand.choice(COMMENTS)
+        row[index.LONG_COMMENTS_INDEX.value] = ', '.join(rand.sample(COMMENTS, 3))
+        if position == 1:
+            row[index.WIN_PAYOFF_INDEX.value] = round(rand.uniform(2.2, 60), 2)
+        if position <= 2:
+            row[index.PLACE_PAYOFF_INDEX.value] = round(rand.uniform(2.1, 30), 2)
+        if position <= 3:
+            row[index.SHOW_PAYOFF_INDEX.value] = round(rand.uniform(2.1, 15), 2)
+        row[index.INDIVIDUAL_HORSE_TIME_INDEX.value] = ''
+        row[index.SPEED_INDEX.value] = rand.randint(40, 110)
+        row[index.BREEDER_NAME_INDEX.value] = f'{name(rand, 2)} {name(rand, 3)}'
+        row[index.JOCKEY_KEY_INDEX.value] = jockey[0]
+        row[index.TRAINER_KEY_INDEX.value] = trainer[0]
+        return row
+
+    @staticmethod
+    def final_time(seconds: float) -> float:
+        minutes = int(seconds // 60)
+        return round(minutes * 100 + seconds - minutes * 60, 2)
+
+    @staticmethod
+    def fraction(seconds: float) -> int:
+        minutes = int(seconds // 60)
+        return round((minutes * 100 + seconds - minutes * 60) * 100)
+
+    def charts(self, count: int, start: date = date(2024, 1, 1)) -> Iterator[list[list]]:
+        for number in range(count):
+            day = start + timedelta(days=number // len(TRACKS))
+            yield self.chart(TRACKS[number % len(TRACKS)], day.strftime('%Y%m%d'))
+
+
+def iter_synthetic_rows(charts: int = 1, seed: int = 0) -> Iterator[list[str]]:
+    for chart in ChartGenerator(seed).charts(charts):
+        for row in chart:
+            yield [str(value) for value in row]
+
+
+def write_synthetic_charts(file: IO[str], charts: int = 1, seed: int = 0) -> None:
+    writer = csv.writer(file, quoting=csv.QUOTE_NONNUMERIC, lineterminator='\r\n')
+    for chart in ChartGenerator(seed).charts(charts):
+        writer.writerows(chart)
@@ -0,0 +1,168 @@
+#! python3
+
+
+from array import array
+from collections.abc import Iterable, Sequence
+from functools import partial
+from operator import eq
+
+from .pool import StringPool, pooled_fields
+from .textchart import STARTER_PERFORMANCE_DATA_PLAN, DecodePlan, RecordType, StarterPerformanceData
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+TYPECODES: dict[type, str] = {
+    int: 'q',
+    float: 'd',
+}
+
+CODE_TYPECODE = 'q'
+
+
+Column = array | list
+
+
+class StarterTable:
+    plan: DecodePlan = STARTER_PERFORMANCE_DATA_PLAN
+
+    def __init__(self, columns: dict[str, Column], pool: StringPool | None = None) -> None:
+        self.columns = columns
+        self.pool = pool
+        self.encoded = self.encoded_fields(pool)
+        self.length = len(next(iter(columns.values()))) if columns else 0
+
+    @classmethod
+    def encoded_fields(cls, pool: StringPool | None) -> frozenset[str]:
+        return frozenset(pooled_fields(cls.plan)) if pool is not None else frozenset()
+
+    @classmethod
+    def typecode(cls, name: str, encoded: frozenset[str]) -> str | None:
+        if name in encoded:
+            return CODE_TYPECODE
+        return TYPECODES.get(cls.plan.record_class.__dataclass_fields__[name].type)
+
+    @classmethod
+    def new_column(cls, name: str, values: Iterable = (), encoded: frozenset[str] = frozenset()) -> Column:
+        typecode = cls.typecode(name, encoded)
+        return list(values) if typecode is None else array(typecode, values)
+
+    @classmethod
+    def empty(cls, pool: StringPool | None = None) -> 'StarterTable':
+        encoded = cls.encoded_fields(pool)
+        return cls({name: cls.new_column(name, (), encoded) for name in cls.plan.fields}, pool)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[list[str]], pool: StringPool | None = None) -> 'StarterTable':
+        starter = RecordType.STARTER.value
+        batch = [row for row in rows if row and row[0] == starter]
+        encoded = cls.encoded_fields(pool)
+        columns = {}
+        for name, (column, converter) in zip(cls.plan.fields, cls.plan.steps):
+            if name in encoded:
+                encode = pool.encode
+                values = [encode(converter(row[column])) for row in batch]
+            else:
+                values = [converter(row[column]) for row in batch]
+            columns[name] = cls.new_column(name, values, encoded)
+        return cls(columns, pool)
+
+    @classmethod
+    def from_records(cls, records: Iterable[StarterPerformanceData],
+                     pool: StringPool | None = None) -> 'StarterTable':
+        records = list(records)
+        encoded = cls.encoded_fields(pool)
+        columns = {}
+        for name in cls.plan.fields:
+            values = [getattr(record, name) for record in records]
+            if name in encoded:
+                values = map(pool.encode, values)
+            columns[name] = cls.new_column(name, values, encoded)
+        return cls(columns, pool)
+
+    @classmethod
+    def concat(cls, tables: Iterable['StarterTable'], pool: StringPool | None = None) -> 'StarterTable':
+        tables = list(tables)
+        if pool is None and tables:
+            pool = tables[0].pool
+        result = cls.empty(pool)
+        for table in tables:
+            result.check_pool(table)
+            for name, column in result.columns.items():
+                column.extend(table.columns[name])
+            result.length += table.length
+        return result
+
+    def check_pool(self, other: 'StarterTable') -> None:
+        if other.pool is not self.pool:
+            raise ValueError('cannot extend a StarterTable with a table encoded by a different StringPool')
+
+    def extend(self, other: 'StarterTable') -> None:
+        self.check_pool(other)
+        self.columns = {name: column + other.columns[name] for name, column in self.columns.items()}
+        self.length += other.length
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, name: str):
+        column = self.columns[name]
+        if numpy is not None and isinstance(column, array):
+            return numpy.frombuffer(column, dtype=column.typecode) if len(column) else numpy.array([], column.typecode)
+        return column
+
+    def code(self, name: str, value: str) -> int | None:
+        if name not in self.encoded:
+            raise KeyError(f'{name!r} is not a dictionary-encoded column')
+        return self.pool.code(value)
+
+    def values(self, name: str) -> list:
+        column = self.columns[name]
+        if name in self.encoded:
+            return [self.pool.values[code] for code in column]
+        return list(column)
+
+    def numeric_fields(self) -> tuple[str, ...]:
+        return tuple(
+            name for name, column in self.columns.items() if isinstance(column, array) and name not in self.encoded
+        )
+
+    def string_fields(self) -> tuple[str, ...]:
+        return tuple(name for name, column in self.columns.items() if isinstance(column, list) or name in self.encoded)
+
+    def take(self, indices: Sequence[int]) -> 'StarterTable':
+        if numpy is not None and isinstance(indices, numpy.ndarray):
+            if indices.dtype == bool:
+                indices = numpy.flatnonzero(indices)
+            indices = indices.tolist()
+        return type(self)({
+            name: self.new_column(name, [column[index] for index in indices], self.encoded)
+            for name, column in self.columns.items()
+        }, self.pool)
+
+    def where(self, name: str, predicate) -> 'StarterTable':
+        column = self.columns[name]
+        if name not in self.encoded:
+            test = predicate if callable(predicate) else partial(eq, predicate)
+            return self.take([index for index, value in enumerate(column) if test(value)])
+        if callable(predicate):
+            decode = self.pool.values
+            matches = {code: predicate(decode[code]) for code in set(column)}
+            return self.take([index for index, code in enumerate(column) if matches[code]])
+        wanted = self.code(name, predicate)
+        return self.take([index for index, code in enumerate(column) if code == wanted])
+
+    def record(self, index: int, record_class: type = StarterPerformanceData) -> StarterPerformanceData:
+        values = [self.columns[name][index] for name in self.plan.fields]
+        if self.encoded:
+            decode = self.pool.values
+            values = [decode[value] if name in self.encoded else value
+                      for name, value in zip(self.plan.fields, values)]
+        return record_class(*values)
+
+    def to_records(self, record_class: type = StarterPerformanceData) -> list[StarterPerformanceData]:
+        columns = [self.values(name) if name in self.encoded else self.columns[name] for name in self.plan.fields]
+        return [record_class(*values) for values in zip(*columns)]
@@ -1,12 +1,36 @@
 #! python3
 
 
-from dataclasses import dataclass
+import csv
+import gzip
+import io
+import os
+import threading
+import zipfile
+from collections.abc import Callable, Iterable, Iterator
+from copy import copy
+from dataclasses import dataclass, fields, make_dataclass
 from enum import Enum
-from math import trunc
+from math import isnan, trunc
+from os import PathLike
+from typing import IO
 
 
-class RecordType(Enum):
+class Code(Enum):
+    pass
+
+    def __eq__(self, other) -> bool:
+        if self.__class__ is other.__class__:
+            return self is other
+        elif other.__class__ is str:
+            return self._value_ == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._value_)
+
+
+class RecordType(Code):
     HEADER = 'H'
     RACE = 'R'
     STARTER = 'S'
@@ -15,43 +39,22 @@ class RecordType(Enum):
     COMMENT = 'C'
     FOOTNOTE = 'F'
 
-    def __eq__(self, other) -> bool:
-        if self.__class__ is other.__class__:
-            return self.value == other.value
-        elif other.__class__ is str:
-            return self.value == other
-        return NotImplemented
 
-
-class BreedIndicator(Enum):
+class BreedIndicator(Code):
     THOROUGHBRED = 'TB'
     QUARTER_HORSE = 'QH'
     ARABIAN = 'AR'
     PAINT = 'PT'
     MIXED_BREEDS = 'MX'
 
-    def __eq__(self, other) -> bool:
-        if self.__class__ is other.__class__:
-            return self.value == other.value
-        elif other.__class__ is str:
-            return self.value == other
-        return NotImplemented
-
 
-class RestrictionCodes(Enum):
+class RestrictionCodes(Code):
     AUCTION = 'A'
     RESTRICTED = 'R'
     STATE_BRED = 'S'
 
-    def __eq__(self, other) -> bool:
-        if self.__class__ is other.__class__:
-            return self.value == other.value
-        elif other.__class__ is str:
-            return self.value == other
-        return NotImplemented
-
 
-class SexRestrictions(Enum):
+class SexRestrictions(Code):
     OPEN = ''
     CG = 'A'
     FM = 'B'
@@ -62,28 +65,14 @@ class SexRestrictions(Enum):
     H = 'H'
     M = 'M'
 
-    def __eq__(self, other) -> bool:
-        if self.__class__ is other.__class__:
-            return self.value == other.value
-        elif other.__class__ is str:
-            return self.value == other
-        return NotImplemented
-
 
-class SurfaceCodes(Enum):
+class SurfaceCodes(Code):
     DIRT = 'D'
     EQUITRACK = 'E'
     TURF = 'T'
 
-    def __eq__(self, other) -> bool:
-        if self.__class__ is other.__class__:
-            return self.value == other.value
-        elif other.__class__ is str:
-            return self.value == other
-        return NotImplemented
-
 
-class CourseCodes(Enum):
+class CourseCodes(Code):
     ALL_WEATHER_TRAINING = 'A'
     DIRT = 'D'
     ALL_WEATHER_TRACK = 'E'
@@ -101,13 +90,6 @@ class CourseCodes(Enum):
     TURF = 'T'
     HUNT_ON_TURF = 'U'
 
-    def __eq__(self, other) -> bool:
-        if self.__class__ is other.__class__:
-            return self.value == other.value
-        elif other.__class__ is str:
-            return self.value == other
-        return NotImplemented
-
 
 class Index(Enum):
     pass
@@ -117,6 +99,9 @@ class Index(Enum):
             return self.value == other.value
         return NotImplemented
 
+    def __hash__(self) -> int:
+        return hash(self._value_)
+
     def __gt__(self, other) -> bool:
         if self.__class__ is other.__class__:
             return self.value > other.value
@@ -373,12 +358,72 @@ def try_get_float(row: list[str], index: Index) -> float:
         return float('nan')
 
 
+Converter = Callable[[str], object]
+
+
+def to_str(value: str) -> str:
+    return value.rstrip()
+
+
+def to_int(value: str) -> int:
+    if value:
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    return int(0)
+
+
+def to_float(value: str) -> float:
+    if value:
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return float('nan')
+
+
+class UnknownCodeError(ValueError):
+    pass
+
+
+MISSING = object()
+
+
+def code_converter(code: type[Code], blank: object = None, unknown: object = MISSING) -> Converter:
+    table = {member._value_: member for member in code}
+    name = code.__name__
+
+    def convert(value: str):
+        value = value.rstrip()
+        member = table.get(value)
+        if member is not None:
+            return member
+        if not value:
+            return blank
+        if unknown is MISSING:
+            raise UnknownCodeError(f'unknown {name} code {value!r}')
+        return unknown
+    return convert
+
+
+CODE_CONVERTERS: dict[type[Code], Converter] = {code: code_converter(code) for code in Code.__subclasses__()}
+
+
+def try_get_code(row: list[str], index: Index, code: type[Code]) -> Code | None:
+    return CODE_CONVERTERS[code](row[index.value])
+
+
 def final_time_to_seconds(final_time: float) -> float:
+    if isnan(final_time):
+        return final_time
     minutes: float = trunc(final_time / 100)
     return round(minutes * 60 + final_time - minutes * 100, 2)
 
 
 def fraction_to_seconds(fraction: float) -> float:
+    if isnan(fraction):
+        return fraction
     minutes: float = trunc(fraction / 10000)
     return round(minutes * 60 + fraction / 100 - minutes * 100, 2)
 
@@ -407,10 +452,10 @@ class Header:
 @dataclass
 class RaceData:
     race_number: int
-    breed_indicator: str
+    breed_indicator: BreedIndicator | None
     race_type: str
-    restrictions: str
-    sex_restriction: str
+    restrictions: RestrictionCodes | None
+    sex_restriction: SexRestrictions | None
     age_restriction: str
     division: str
     purse: int
@@ -436,8 +481,8 @@ class RaceData:
     about_distance_indicator: str
     distance: int
     distance_unit: str
-    surface: str
-    course_type: str
+    surface: SurfaceCodes | None
+    course_type: CourseCodes | None
     number_of_horses: int
     race_grade: str
     race_name: str
@@ -474,10 +519,10 @@ class RaceData:
     def create(row: list[str]) -> 'RaceData':
         return RaceData(
             try_get_int(row, RaceDataIndex.RACE_NUMBER_INDEX),
-            try_get_str(row, RaceDataIndex.BREED_INDICATOR_INDEX),
+            try_get_code(row, RaceDataIndex.BREED_INDICATOR_INDEX, BreedIndicator),
             try_get_str(row, RaceDataIndex.RACE_TYPE_INDEX),
-            try_get_str(row, RaceDataIndex.RESTRICTIONS_INDEX),
-            try_get_str(row, RaceDataIndex.SEX_RESTRICTION_INDEX),
+            try_get_code(row, RaceDataIndex.RESTRICTIONS_INDEX, RestrictionCodes),
+            try_get_code(row, RaceDataIndex.SEX_RESTRICTION_INDEX, SexRestrictions),
             try_get_str(row, RaceDataIndex.AGE_RESTRICTION_INDEX),
             try_get_str(row, RaceDataIndex.DIVISION_INDEX),
             try_get_int(row, RaceDataIndex.PURSE_USA_INDEX),
@@ -503,8 +548,8 @@ class RaceData:
             try_get_str(row, RaceDataIndex.ABOUT_DISTANCE_INDICATOR_INDEX),
             try_get_int(row, RaceDataIndex.DISTANCE_INDEX),
             try_get_str(row, RaceDataIndex.DISTANCE_UNIT_INDEX),
-            try_get_str(row, RaceDataIndex.SURFACE_INDEX),
-            try_get_str(row, RaceDataIndex.COURSE_TYPE_INDEX),
+            try_get_code(row, RaceDataIndex.SURFACE_INDEX, SurfaceCodes),
+            try_get_code(row, RaceDataIndex.COURSE_TYPE_INDEX, CourseCodes),
             try_get_int(row, RaceDataIndex.NUMBER_OF_HORSES_INDEX),
             try_get_str(row, RaceDataIndex.RACE_GRADE_INDEX),
             try_get_str(row, RaceDataIndex.RACE_NAME_INDEX),
@@ -759,3 +804,373 @@ class StarterPerformanceData:
             try_get_int(row, StarterPerformanceDataIndex.JOCKEY_KEY_INDEX),
             try_get_int(row, StarterPerformanceDataIndex.TRAINER_KEY_INDEX)
         )
+
+
+@dataclass
+class CommentsAndRaceOdditiesData:
+    race_number: int
+    result_country_code: str
+    track_code: str
+    race_date: str
+    result_race_number: int
+    result_time_flag: str
+    comment_type: str
+    comment_text: str
+
+    @staticmethod
+    def create(row: list[str]) -> 'CommentsAndRaceOdditiesData':
+        return CommentsAndRaceOdditiesData(
+            try_get_int(row, CommentsAndRaceOdditiesDataIndex.RACE_NUMBER_INDEX),
+            try_get_str(row, CommentsAndRaceOdditiesDataIndex.RESULT_COUNTRY_CODE_INDEX),
+            try_get_str(row, CommentsAndRaceOdditiesDataIndex.TRACK_CODE_INDEX),
+            try_get_str(row, CommentsAndRaceOdditiesDataIndex.RACE_DATE_INDEX),
+            try_get_int(row, CommentsAndRaceOdditiesDataIndex.RESULT_RACE_NUMBER_INDEX),
+            try_get_str(row, CommentsAndRaceOdditiesDataIndex.RESULT_DAY_EVENING_FLAG_INDEX),
+            try_get_str(row, CommentsAndRaceOdditiesDataIndex.COMMENT_TYPE_INDEX),
+            try_get_str(row, CommentsAndRaceOdditiesDataIndex.COMMENT_TEXT_INDEX)
+        )
+
+
+@dataclass
+class FootNotes:
+    race_number: int
+    sequence_number: int
+    text: str
+
+    @staticmethod
+    def create(row: list[str]) -> 'FootNotes':
+        return FootNotes(
+            try_get_int(row, FootNotesIndex.RACE_NUMBER_INDEX),
+            try_get_int(row, FootNotesIndex.FOOT_NOTE_SEQUENCE_NUMBER_INDEX),
+            try_get_str(row, FootNotesIndex.FOOT_NOTE_TEXT_INDEX)
+        )
+
+
+CONVERTERS: dict[type, Converter] = {
+    str: to_str,
+    int: to_int,
+    float: to_float,
+    **{code | None: converter for code, converter in CODE_CONVERTERS.items()},
+}
+
+
+def final_time_value(value: str) -> float:
+    return final_time_to_seconds(to_float(value))
+
+
+def fraction_value(value: str) -> float:
+    return fraction_to_seconds(to_float(value))
+
+
+def record_columns(index: type[Index], skip: tuple[Index, ...] = ()) -> tuple[Index, ...]:
+    return tuple(member for member in index if member.name != 'RECORD_TYPE_INDEX' and member not in skip)
+
+
+PROJECTIONS: dict[tuple[type, tuple[str, ...]], type] = {}
+PROJECTIONS_LOCK = threading.Lock()
+
+
+def projected_record(record_class: type, names: tuple[str, ...], values: tuple) -> object:
+    return projected_class(record_class, names)(*values)
+
+
+def reduce_projection(record: object) -> tuple:
+    record_class, names = record.projected_from
+    return projected_record, (record_class, names, tuple(getattr(record, name) for name in names))
+
+
+def projected_class(record_class: type, names: tuple[str, ...]) -> type:
+    key = (record_class, names)
+    projection = PROJECTIONS.get(key)
+    if projection is not None:
+        return projection
+    with PROJECTIONS_LOCK:
+        projection = PROJECTIONS.get(key)
+        if projection is None:
+            types = {field.name: field.type for field in fields(record_class)}
+            projection = make_dataclass(
+                f'{record_class.__name__}Projection',
+                [(name, types[name]) for name in names],
+                namespace={'projected_from': (record_class, names), '__reduce__': reduce_projection},
+                slots=True
+            )
+            projection.__module__ = __name__
+            PROJECTIONS[key] = projection
+    return projection
+
+
+class DecodePlan:
+
+    def __init__(self, record_class: type, columns: tuple[Index, ...],
+                 converters: dict[str, Converter] | None = None) -> None:
+        converters = converters or {}
+        self.record_class = record_class
+        self.fields = tuple(field.name for field in fields(record_class))
+        self.steps: tuple[tuple[int, Converter], ...] = tuple(
+            (index.value, converters.get(field.name) or CONVERTERS[field.type])
+            for field, index in zip(fields(record_class), columns, strict=True)
+        )
+
+    def decode(self, row: list[str]):
+        return self.record_class(*[converter(row[column]) for column, converter in self.steps])
+
+    def bind(self, record_class: type) -> 'DecodePlan':
+        if tuple(field.name for field in fields(record_class)) != self.fields:
+            raise TypeError(f'{record_class.__name__} fields do not match {self.record_class.__name__}')
+        plan = copy(self)
+        plan.record_class = record_class
+        return plan
+
+    def converter(self, name: str) -> Converter:
+        return self.steps[self.fields.index(name)][1]
+
+    def project(self, names: tuple[str, ...]) -> 'DecodePlan':
+        for name in names:
+            if name not in self.fields:
+                raise KeyError(f'{self.record_class.__name__} has no field {name!r}')
+        plan = copy(self)
+        plan.record_class = projected_class(self.record_class, names)
+        plan.fields = names
+        plan.steps = tuple(self.steps[self.fields.index(name)] for name in names)
+        return plan
+
+    def column(self, name: str) -> int:
+        return self.steps[self.fields.index(name)][0]
+
+    def replace(self, converters: dict[str, Converter]) -> 'DecodePlan':
+        for name in converters:
+            if name not in self.fields:
+                raise KeyError(f'{self.record_class.__name__} has no field {name!r}')
+        plan = copy(self)
+        plan.steps = tuple(
+            (column, converters.get(name, converter)) for name, (column, converter) in zip(self.fields, self.steps)
+        )
+        return plan
+
+
+HEADER_PLAN = DecodePlan(Header, record_columns(HeaderIndex))
+
+RACE_DATA_PLAN = DecodePlan(
+    RaceData,
+    record_columns(RaceDataIndex),
+    {
+        'final_time': final_time_value,
+        'fraction1': fraction_value,
+        'fraction2': fraction_value,
+        'fraction3': fraction_value,
+        'fraction4': fraction_value,
+        'fraction5': fraction_value,
+    }
+)
+
+EXOTIC_WAGERING_DATA_PLAN = DecodePlan(ExoticWageringData, record_columns(ExoticWageringDataIndex))
+
+ATTENDANCE_AND_HANDLE_DATA_PLAN = DecodePlan(AttendanceAndHandleData, record_columns(AttendanceAndHandleDataIndex))
+
+COMMENTS_AND_RACE_ODDITIES_DATA_PLAN = DecodePlan(
+    CommentsAndRaceOdditiesData,
+    record_columns(CommentsAndRaceOdditiesDataIndex)
+)
+
+FOOT_NOTES_PLAN = DecodePlan(FootNotes, record_columns(FootNotesIndex))
+
+STARTER_PERFORMANCE_DATA_PLAN = DecodePlan(
+    StarterPerformanceData,
+    record_columns(
+        StarterPerformanceDataIndex,
+        (
+            StarterPerformanceDataIndex.BROODMARES_SIRES_NAME_INDEX,
+            StarterPerformanceDataIndex.BROODMARES_SIRES_YEAR_OF_BIRTH_INDEX,
+            StarterPerformanceDataIndex.BROODMARES_SIRES_BREED_TYPE_INDEX,
+            StarterPerformanceDataIndex.SIRES_SIRES_NAME_INDEX,
+            StarterPerformanceDataIndex.SIRES_SIRES_YEAR_OF_BIRTH_INDEX,
+            StarterPerformanceDataIndex.SIRES_SIRES_BREED_TYPE_INDEX,
+        )
+    )
+)
+
+
+PLANS: dict[str, DecodePlan] = {
+    RecordType.HEADER.value: HEADER_PLAN,
+    RecordType.RACE.value: RACE_DATA_PLAN,
+    RecordType.STARTER.value: STARTER_PERFORMANCE_DATA_PLAN,
+    RecordType.EXOTIC_WAGERING.value: EXOTIC_WAGERING_DATA_PLAN,
+    RecordType.ATTENDANCE.value: ATTENDANCE_AND_HANDLE_DATA_PLAN,
+    RecordType.COMMENT.value: COMMENTS_AND_RACE_ODDITIES_DATA_PLAN,
+    RecordType.FOOTNOTE.value: FOOT_NOTES_PLAN,
+}
+
+
+CODE_FIELDS: dict[str, dict[str, type[Code]]] = {
+    RecordType.RACE.value: {
+        'breed_indicator': BreedIndicator,
+        'restrictions': RestrictionCodes,
+        'sex_restriction': SexRestrictions,
+        'surface': SurfaceCodes,
+        'course_type': CourseCodes,
+    },
+}
+
+
+def coded_plans(plans: dict[str, DecodePlan] | None = None, unknown: object = MISSING) -> dict[str, DecodePlan]:
+    plans = dict(plans or PLANS)
+    for record_type, codes in CODE_FIELDS.items():
+        plans[record_type] = plans[record_type].replace({
+            name: code_converter(code, unknown=unknown) for name, code in codes.items()
+        })
+    return plans
+
+
+def compact_class(record_class: type) -> type:
+    compact = make_dataclass(
+        f'Compact{record_class.__name__}',
+        [(field.name, field.type) for field in fields(record_class)],
+        slots=True
+    )
+    compact.__module__ = __name__
+    return compact
+
+
+CompactHeader = compact_class(Header)
+CompactRaceData = compact_class(RaceData)
+CompactExoticWageringData = compact_class(ExoticWageringData)
+CompactAttendanceAndHandleData = compact_class(AttendanceAndHandleData)
+CompactStarterPerformanceData = compact_class(StarterPerformanceData)
+CompactCommentsAndRaceOdditiesData = compact_class(CommentsAndRaceOdditiesData)
+CompactFootNotes = compact_class(FootNotes)
+
+
+COMPACT_PLANS: dict[str, DecodePlan] = {
+    RecordType.HEADER.value: HEADER_PLAN.bind(CompactHeader),
+    RecordType.RACE.value: RACE_DATA_PLAN.bind(CompactRaceData),
+    RecordType.STARTER.value: STARTER_PERFORMANCE_DATA_PLAN.bind(CompactStarterPerformanceData),
+    RecordType.EXOTIC_WAGERING.value: EXOTIC_WAGERING_DATA_PLAN.bind(CompactExoticWageringData),
+    RecordType.ATTENDANCE.value: ATTENDANCE_AND_HANDLE_DATA_PLAN.bind(CompactAttendanceAndHandleData),
+    RecordType.COMMENT.value: COMMENTS_AND_RACE_ODDITIES_DATA_PLAN.bind(CompactCommentsAndRaceOdditiesData),
+    RecordType.FOOTNOTE.value: FOOT_NOTES_PLAN.bind(CompactFootNotes),
+}
+
+
+Record = (Header | RaceData | ExoticWageringData | AttendanceAndHandleData | StarterPerformanceData
+          | CommentsAndRaceOdditiesData | FootNotes)
+Source = str | PathLike | IO[str]
+
+
+FACTORIES: dict[str, Callable[[list[str]], Record]] = {
+    record_type: plan.decode for record_type, plan in PLANS.items()
+}
+
+COMPACT_FACTORIES: dict[str, Callable[[list[str]], object]] = {
+    record_type: plan.decode for record_type, plan in COMPACT_PLANS.items()
+}
+
+
+def zip_members(archive: zipfile.ZipFile) -> list[str]:
+    return [member.filename for member in archive.infolist() if not member.is_dir()]
+
+
+def iter_zip_rows(archive: zipfile.ZipFile, name: str, encoding: str = 'latin-1') -> Iterator[list[str]]:
+    with archive.open(name) as member:
+        yield from csv.reader(io.TextIOWrapper(member, encoding=encoding, newline=''))
+
+
+def iter_rows(source: Source, encoding: str = 'latin-1') -> Iterator[list[str]]:
+    if isinstance(source, (str, PathLike)):
+        suffix = os.path.splitext(source)[1].lower()
+        if suffix == '.zip':
+            with zipfile.ZipFile(source) as archive:
+                for name in zip_members(archive):
+                    yield from iter_zip_rows(archive, name, encoding)
+        elif suffix == '.gz':
+            with gzip.open(source, 'rt', newline='', encoding=encoding) as file:
+                yield from csv.reader(file)
+        else:
+            with open(source, newline='', encoding=encoding) as file:
+                yield from csv.reader(file)
+    else:
+        yield from csv.reader(source)
+
+
+def record_factories(compact: bool = False,
+                     plans: dict[str, DecodePlan] | None = None) -> dict[str, Callable[[list[str]], Record]]:
+    if plans is not None:
+        return {record_type: plan.decode for record_type, plan in plans.items()}
+    return COMPACT_FACTORIES if compact else FACTORIES
+
+
+RecordTypes = str | RecordType
+Predicate = str | int | Iterable[str | int] | Callable[[str], bool]
+
+
+def record_type_value(record_type: RecordTypes) -> str:
+    return RecordType(record_type).value
+
+
+def selected_plans(plans: dict[str, DecodePlan], record_types: Iterable[RecordTypes] | None = None,
+                   projection: dict[RecordTypes, Iterable[str]] | None = None) -> dict[str, DecodePlan]:
+    if isinstance(record_types, (str, RecordType)):
+        record_types = (record_types,)
+    if record_types is not None:
+        wanted = {record_type_value(record_type) for record_type in record_types}
+        plans = {record_type: plan for record_type, plan in plans.items() if record_type in wanted}
+    if projection is not None:
+        plans = dict(plans)
+        for record_type, names in projection.items():
+            record_type = record_type_value(record_type)
+            if record_type in plans:
+                plans[record_type] = plans[record_type].project(tuple(names))
+    return plans
+
+
+def raw_test(predicate: Predicate) -> Callable[[str], bool]:
+    if callable(predicate):
+        return lambda value: predicate(value.strip())
+    if isinstance(predicate, (str, int)):
+        predicate = (predicate,)
+    values = frozenset(str(value).strip() for value in predicate)
+    return lambda value: value.strip() in values
+
+
+def row_checks(where: dict[str, Predicate]) -> dict[str, tuple[tuple[int, Callable[[str], bool]], ...]]:
+    for name in where:
+        if not any(name in plan.fields for plan in PLANS.values()):
+            raise KeyError(f'no record type has a field {name!r}')
+    tests = {name: raw_test(predicate) for name, predicate in where.items()}
+    return {
+        record_type: tuple((plan.column(name), test) for name, test in tests.items() if name in plan.fields)
+        for record_type, plan in PLANS.items()
+    }
+
+
+def iter_records(source: Source, encoding: str = 'latin-1', compact: bool = False,
+                 plans: dict[str, DecodePlan] | None = None, record_types: Iterable[RecordTypes] | None = None,
+                 fields: dict[RecordTypes, Iterable[str]] | None = None,
+                 where: dict[str, Predicate] | None = None) -> Iterator[Record]:
+    if record_types is not None or fields is not None:
+        plans = selected_plans(plans or (COMPACT_PLANS if compact else PLANS), record_types, fields)
+    factories = record_factories(compact, plans)
+    record_type = HeaderIndex.RECORD_TYPE_INDEX.value
+    if where is None:
+        for row in iter_rows(source, encoding):
+            if not row:
+                continue
+            factory = factories.get(row[record_type])
+            if factory is not None:
+                yield factory(row)
+        return
+    checks = row_checks(where)
+    header = RecordType.HEADER.value
+    chart_selected = True
+    for row in iter_rows(source, encoding):
+        if not row:
+            continue
+        kind = row[record_type]
+        if kind == header:
+            chart_selected = all(test(row[column]) for column, test in checks[header])
+        elif not chart_selected:
+            continue
+        factory = factories.get(kind)
+        if factory is None:
+            continue
+        if all(test(row[column]) for column, test in checks.get(kind, ())):
+            yield factory(row)
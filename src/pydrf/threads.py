@@ -0,0 +1,75 @@
+#! python3
+
+
+import gzip
+import io
+import os
+import zipfile
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from os import PathLike
+from typing import BinaryIO
+
+from .ingest import Path
+from .textchart import COMPACT_PLANS, PLANS, DecodePlan, Record, RecordTypes, iter_records, selected_plans, zip_members
+
+
+CHUNK_SIZE = 1 << 20
+
+
+def iter_binary_streams(path: Path) -> Iterator[BinaryIO]:
+    suffix = os.path.splitext(path)[1].lower()
+    if suffix == '.zip':
+        with zipfile.ZipFile(path) as archive:
+            for name in zip_members(archive):
+                with archive.open(name) as member:
+                    yield member
+    elif suffix == '.gz':
+        with gzip.open(path, 'rb') as file:
+            yield file
+    else:
+        with open(path, 'rb') as file:
+            yield file
+
+
+def iter_chunks(file: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    remainder = b''
+    while block := file.read(chunk_size):
+        block = remainder + block
+        end = block.rfind(b'\n') + 1
+        remainder = block[end:]
+        if end:
+            yield block[:end]
+    if remainder:
+        yield remainder
+
+
+def decode_chunk(chunk: bytes, plans: dict[str, DecodePlan], encoding: str = 'latin-1') -> list[Record]:
+    return list(iter_records(io.StringIO(chunk.decode(encoding), newline=''), plans=plans))
+
+
+def iter_threaded_records(sources: Path | Iterable[Path], workers: int | None = None, chunk_size: int = CHUNK_SIZE,
+                          max_pending: int | None = None, encoding: str = 'latin-1', compact: bool = False,
+                          plans: dict[str, DecodePlan] | None = None,
+                          record_types: Iterable[RecordTypes] | None = None,
+                          fields: dict[RecordTypes, Iterable[str]] | None = None) -> Iterator[Record]:
+    if isinstance(sources, (str, PathLike)):
+        sources = [sources]
+    plans = selected_plans(plans or (COMPACT_PLANS if compact else PLANS), record_types, fields)
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * workers
+    pending: deque[Future] = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            for path in sources:
+                for file in iter_binary_streams(path):
+                    for chunk in iter_chunks(file, chunk_size):
+                        pending.append(executor.submit(decode_chunk, chunk, plans, encoding))
+                        if len(pending) >= max_pending:
+                            yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
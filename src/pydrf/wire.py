@@ -0,0 +1,146 @@
+#! python3
+
+
+import pickle
+import threading
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass, fields
+from itertools import groupby, islice
+from operator import attrgetter
+
+from .textchart import Record, projected_class
+
+
+TYPECODES: dict[type, str] = {
+    int: 'q',
+    float: 'd',
+}
+
+INTEGER_TYPECODES = ('b', 'h', 'i', 'q')
+
+Schema = tuple[tuple[str, ...], tuple[str | None, ...]]
+
+SCHEMAS: dict[type, Schema] = {}
+SCHEMAS_LOCK = threading.Lock()
+
+
+def schema(record_class: type) -> Schema:
+    cached = SCHEMAS.get(record_class)
+    if cached is not None:
+        return cached
+    with SCHEMAS_LOCK:
+        cached = SCHEMAS.get(record_class)
+        if cached is None:
+            record_fields = fields(record_class)
+            cached = SCHEMAS[record_class] = (
+                tuple(field.name for field in record_fields),
+                tuple(TYPECODES.get(field.type) for field in record_fields),
+            )
+    return cached
+
+
+def integer_array(values: list[int]) -> array:
+    if not values:
+        return array('b')
+    low, high = min(values), max(values)
+    for typecode in INTEGER_TYPECODES:
+        limit = 1 << (8 * array(typecode).itemsize - 1)
+        if -limit <= low and high < limit:
+            return array(typecode, values)
+    raise OverflowError('integer column does not fit a 64-bit array')
+
+
+def float_array(values: list[float]) -> array:
+    exact = array('d', values)
+    single = array('f', exact)
+    if array('d', single).tobytes() == exact.tobytes():
+        return single
+    return exact
+
+
+@dataclass
+class RecordBlock:
+    record_class: type
+    count: int
+    columns: list[array]
+    values: list
+
+    @staticmethod
+    def create(record_class: type, records: list) -> 'RecordBlock':
+        names, typecodes = schema(record_class)
+        getter = attrgetter(*names)
+        rows = zip(*map(getter, records)) if len(names) > 1 else (list(map(getter, records)),)
+        table: dict[tuple[type, object], int] = {}
+        columns = []
+        for name, typecode, column in zip(names, typecodes, rows):
+            try:
+                if typecode == 'q':
+                    columns.append(integer_array(column))
+                elif typecode == 'd':
+                    columns.append(float_array(column))
+                else:
+                    columns.append(integer_array([table.setdefault((value.__class__, value), len(table))
+                                                  for value in column]))
+            except (TypeError, OverflowError):
+                raise TypeError(f'{record_class.__name__}.{name} cannot be packed as {typecode!r}') from None
+        return RecordBlock(record_class, len(records), columns, [value for _, value in table])
+
+    def __reduce__(self) -> tuple:
+        projected_from = getattr(self.record_class, 'projected_from', None)
+        if projected_from is None:
+            return RecordBlock, (self.record_class, self.count, self.columns, self.values)
+        return projected_block, (*projected_from, self.count, self.columns, self.values)
+
+    def unpack(self) -> list:
+        _, typecodes = schema(self.record_class)
+        lookup = self.values.__getitem__
+        columns = [
+            column if typecode is not None else map(lookup, column)
+            for typecode, column in zip(typecodes, self.columns)
+        ]
+        return list(map(self.record_class, *columns))
+
+
+def projected_block(record_class: type, names: tuple[str, ...], count: int, columns: list[array],
+                    values: list) -> RecordBlock:
+    return RecordBlock(projected_class(record_class, names), count, columns, values)
+
+
+@dataclass
+class WireBatch:
+    blocks: list[RecordBlock]
+    runs: array
+
+    def __len__(self) -> int:
+        return sum(block.count for block in self.blocks)
+
+    def unpack(self) -> list[Record]:
+        blocks = [iter(block.unpack()) for block in self.blocks]
+        records = []
+        for index in range(0, len(self.runs), 2):
+            records.extend(islice(blocks[self.runs[index]], self.runs[index + 1]))
+        return records
+
+
+def pack(records: Iterable[Record]) -> WireBatch:
+    groups: dict[type, list] = {}
+    indexes: dict[type, int] = {}
+    runs = array('q')
+    for record_class, run in groupby(records, type):
+        group = groups.get(record_class)
+        if group is None:
+            group = groups[record_class] = []
+            indexes[record_class] = len(indexes)
+        before = len(group)
+        group.extend(run)
+        runs.extend((indexes[record_class], len(group) - before))
+    return WireBatch([RecordBlock.create(record_class, group) for record_class, group in groups.items()], runs)
+
+
+def dumps(records: Iterable[Record]) -> bytes:
+    return pickle.dumps(pack(records), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def loads(data: bytes) -> list[Record]:
+    return pickle.loads(data).unpack()
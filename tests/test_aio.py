@@ -0,0 +1,43 @@
+#! python3
+
+
+import os
+import unittest
+
+from pydrf.aio import aiter_batches, aiter_records
+from pydrf.textchart import iter_records
+
+
+SAMPLE_CHART = os.path.join(os.path.dirname(__file__), 'data', 'sample_chart.txt')
+
+
+class AsyncIngestTestCase(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.records = list(iter_records(SAMPLE_CHART))
+
+    async def test_records(self):
+        records = [record async for record in aiter_records([SAMPLE_CHART] * 3, concurrency=2, batch_size=4)]
+        self.assertEqual(len(records), len(self.records) * 3)
+        self.assertEqual(sorted(map(repr, records)), sorted(map(repr, self.records * 3)))
+
+    async def test_batches_keep_source_order(self):
+        sources = [SAMPLE_CHART, os.path.join(os.path.dirname(SAMPLE_CHART), '.', 'sample_chart.txt')]
+        collected = {source: [] for source in sources}
+        async for source, batch in aiter_batches(sources, concurrency=2, batch_size=3, max_pending=1):
+            self.assertLessEqual(len(batch), 3)
+            collected[source].extend(batch)
+        for records in collected.values():
+            self.assertEqual(repr(records), repr(self.records))
+
+    async def test_errors_propagate(self):
+        with self.assertRaises(FileNotFoundError):
+            async for _ in aiter_records([SAMPLE_CHART, SAMPLE_CHART + '.missing'], batch_size=2):
+                pass
+
+    async def test_early_exit(self):
+        records = aiter_records([SAMPLE_CHART] * 10, concurrency=3, batch_size=1, max_pending=1)
+        async for record in records:
+            break
+        await records.aclose()
+        self.assertEqual(repr(record), repr(self.records[0]))
@@ -0,0 +1,51 @@
+#! python3
+
+
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+
+from pydrf.archive import archive_members, iter_archive_records, map_members
+from pydrf.races import iter_races
+from pydrf.textchart import iter_records
+
+
+SAMPLE_CHART = os.path.join(os.path.dirname(__file__), 'data', 'sample_chart.txt')
+
+
+class ArchiveTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.records = repr(list(iter_records(SAMPLE_CHART)))
+        self.gz = os.path.join(self.directory, 'sample_chart.txt.gz')
+        with open(SAMPLE_CHART, 'rb') as source, gzip.open(self.gz, 'wb') as target:
+            shutil.copyfileobj(source, target)
+        self.zip = os.path.join(self.directory, 'season.zip')
+        with zipfile.ZipFile(self.zip, 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr('charts/', '')
+            archive.write(SAMPLE_CHART, 'charts/sar20250801.txt')
+            archive.write(SAMPLE_CHART, 'charts/sar20250802.txt')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_gzip(self):
+        self.assertEqual(repr(list(iter_records(self.gz))), self.records)
+        self.assertEqual([race.race_number for race in iter_races(self.gz)], [1, 2])
+
+    def test_zip(self):
+        self.assertEqual(archive_members(self.zip), ['charts/sar20250801.txt', 'charts/sar20250802.txt'])
+        records = list(iter_records(self.zip))
+        self.assertEqual(repr(records[:len(records) // 2]), self.records)
+        self.assertEqual(repr(records[len(records) // 2:]), self.records)
+
+    def test_members_in_parallel(self):
+        results = dict(map_members(self.zip, workers=2))
+        self.assertEqual(set(results), {'charts/sar20250801.txt', 'charts/sar20250802.txt'})
+        self.assertEqual(repr(results['charts/sar20250802.txt']), self.records)
+        records = list(iter_archive_records([self.zip, self.gz, SAMPLE_CHART], workers=1, compact=True))
+        self.assertEqual(len(records), 4 * len(list(iter_records(SAMPLE_CHART))))
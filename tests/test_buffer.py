@@ -0,0 +1,64 @@
+#! python3
+
+
+import csv
+import io
+import mmap
+import os
+import unittest
+
+from pydrf.buffer import iter_buffer_records, iter_mmap_records
+from pydrf.synthetic import write_synthetic_charts
+from pydrf.textchart import StarterPerformanceDataIndex, iter_records, iter_rows
+
+
+SAMPLE_CHART = os.path.join(os.path.dirname(__file__), 'data', 'sample_chart.txt')
+
+
+class BufferRecordsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        with open(SAMPLE_CHART, 'rb') as file:
+            self.data = file.read()
+        self.expected = repr(list(iter_records(SAMPLE_CHART)))
+
+    def test_bytes_memoryview_and_mmap(self):
+        self.assertEqual(repr(list(iter_buffer_records(self.data))), self.expected)
+        self.assertEqual(repr(list(iter_buffer_records(memoryview(self.data)))), self.expected)
+        self.assertEqual(repr(list(iter_mmap_records(SAMPLE_CHART))), self.expected)
+        with open(SAMPLE_CHART, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            self.assertEqual(repr(list(iter_buffer_records(buffer, compact=True))),
+                             repr(list(iter_records(SAMPLE_CHART, compact=True))))
+
+    def test_synthetic_charts(self):
+        file = io.StringIO(newline='')
+        write_synthetic_charts(file, charts=2, seed=11)
+        text = file.getvalue()
+        self.assertEqual(repr(list(iter_buffer_records(text.encode('latin-1')))),
+                         repr(list(iter_records(io.StringIO(text, newline='')))))
+
+    def test_projection(self):
+        fields = {'S': ('horse_key', 'odds', 'official_finish')}
+        starters = list(iter_buffer_records(self.data, record_types='S', fields=fields))
+        self.assertEqual(repr(starters), repr(list(iter_records(SAMPLE_CHART, record_types='S', fields=fields))))
+        self.assertEqual(starters[0].odds, 2.5)
+
+    def test_quoted_commas_and_escaped_quotes(self):
+        row = next(row for row in iter_rows(SAMPLE_CHART) if row[0] == 'S')
+        for name in ('Alpha, "The Great"', 'a",b', '"a",b', 'a""'):
+            row[StarterPerformanceDataIndex.HORSE_NAME_INDEX.value] = name
+            file = io.StringIO(newline='')
+            csv.writer(file).writerow(row)
+            data = file.getvalue().encode('latin-1')
+            record = next(iter_buffer_records(data))
+            self.assertEqual(record.horse_name, name)
+            self.assertEqual(record.odds, 2.5)
+            self.assertEqual(repr(record), repr(next(iter_records(io.StringIO(file.getvalue(), newline='')))))
+        fields = {'S': ('horse_name', 'odds')}
+        line = self.data.splitlines()[2].replace(b'"Alpha"', b'"a"",b"')
+        record = next(iter_buffer_records(line, record_types='S', fields=fields))
+        self.assertEqual((record.horse_name, record.odds), ('a",b', 2.5))
+
+    def test_short_row(self):
+        with self.assertRaises(IndexError):
+            list(iter_buffer_records(b'"S",1,"1001"\r\n'))
@@ -0,0 +1,70 @@
+#! python3
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from pydrf.cache import ChartCache, Fingerprint, Snapshot, write_snapshot
+from pydrf.textchart import BreedIndicator, coded_plans, iter_records
+
+
+SAMPLE_CHART = os.path.join(os.path.dirname(__file__), 'data', 'sample_chart.txt')
+
+
+class ChartCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.source = os.path.join(self.directory, 'chart.txt')
+        shutil.copy(SAMPLE_CHART, self.source)
+        self.records = list(iter_records(self.source))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_round_trip(self):
+        cache = ChartCache(os.path.join(self.directory, 'cache'))
+        self.assertFalse(cache.is_valid(self.source))
+        self.assertEqual(repr(list(cache.records(self.source))), repr(self.records))
+        self.assertTrue(cache.is_valid(self.source))
+        with Snapshot(cache.path_for(self.source)) as snapshot:
+            self.assertEqual(len(snapshot), len(self.records))
+            self.assertEqual(snapshot.count('S'), 6)
+            self.assertEqual(list(snapshot.column('S', 'official_finish')), [1, 2, 3, 2, 1, 3])
+            self.assertEqual(snapshot.column('S', 'horse_name')[4], 'Echo')
+            self.assertEqual(repr(list(snapshot.records())), repr(self.records))
+
+    def test_code_columns(self):
+        records = list(iter_records(self.source, plans=coded_plans()))
+        path = os.path.join(self.directory, 'coded.snapshot')
+        write_snapshot(path, records, Fingerprint.create(self.source))
+        with Snapshot(path) as snapshot:
+            restored = list(snapshot.records())
+            self.assertEqual(repr(restored), repr(records))
+            self.assertIs(restored[1].breed_indicator, BreedIndicator.THOROUGHBRED)
+            self.assertIsNone(snapshot.column('R', 'restrictions')[0])
+        records[1].breed_indicator = object()
+        with self.assertRaises(TypeError):
+            write_snapshot(path, records, Fingerprint.create(self.source))
+
+    def test_invalidation(self):
+        cache = ChartCache(os.path.join(self.directory, 'cache'))
+        cache.load(self.source).close()
+        with open(self.source, 'a', newline='') as file:
+            file.write('"F",2,3,"Late note."\r\n')
+        self.assertFalse(cache.is_valid(self.source))
+        cache.load(self.source).close()
+        self.assertTrue(cache.is_valid(self.source))
+
+    def test_content_hash(self):
+        cache = ChartCache(os.path.join(self.directory, 'cache'), content_hash=True)
+        cache.load(self.source).close()
+        stat = os.stat(self.source)
+        os.utime(self.source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertTrue(cache.is_valid(self.source))
+        with open(self.source, 'r+b') as file:
+            file.seek(5)
+            file.write(b'C')
+        self.assertFalse(cache.is_valid(self.source))
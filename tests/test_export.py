@@ -0,0 +1,73 @@
+#! python3
+
+
+import os
+import sqlite3
+import unittest
+
+from pydrf.export import TABLES, SQLiteExporter, export_files, export_records
+from pydrf.textchart import coded_plans, iter_records
+
+
+SAMPLE_CHART = os.path.join(os.path.dirname(__file__), 'data', 'sample_chart.txt')
+
+
+class SQLiteExportTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.connection = sqlite3.connect(':memory:')
+
+    def tearDown(self):
+        self.connection.close()
+
+    def count(self, table: str) -> int:
+        return self.connection.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0]
+
+    def test_schema_from_dataclasses(self):
+        SQLiteExporter(self.connection)
+        columns = self.connection.execute('PRAGMA table_info("starter_performance_data")').fetchall()
+        names = [column[1] for column in columns]
+        self.assertEqual(names[:3], ['chart_track_code', 'chart_race_date', 'race_number'])
+        self.assertEqual(names[2:], list(TABLES['S'].fields))
+        types = {column[1]: column[2] for column in columns}
+        self.assertEqual((types['odds'], types['horse_name'], types['race_number']), ('REAL', 'TEXT', 'INTEGER'))
+
+    def test_export(self):
+        counts = export_records(self.connection, iter_records(SAMPLE_CHART), batch_size=2)
+        self.assertEqual(counts['starter_performance_data'], 6)
+        self.assertEqual(counts['header'], 1)
+        self.assertEqual(self.count('exotic_wagering_data'), 2)
+        row = self.connection.execute(
+            'SELECT chart_track_code, chart_race_date, horse_name FROM starter_performance_data '
+            'WHERE race_number = 2 ORDER BY horse_name LIMIT 1'
+        ).fetchone()
+        self.assertEqual(row, ('SAR', '20250801', 'Delta'))
+        indexes = {row[0] for row in self.connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertIn('starter_performance_data_horse_key', indexes)
+
+    def test_incremental_append_is_idempotent(self):
+        export_records(self.connection, iter_records(SAMPLE_CHART))
+        export_records(self.connection, iter_records(SAMPLE_CHART, compact=True))
+        export_records(self.connection, iter_records(SAMPLE_CHART, where={'race_number': 2}))
+        self.assertEqual(self.count('header'), 1)
+        self.assertEqual(self.count('race_data'), 2)
+        self.assertEqual(self.count('starter_performance_data'), 6)
+        self.assertEqual(self.count('foot_notes'), 3)
+
+    def test_same_chart_twice_in_one_export(self):
+        records = list(iter_records(SAMPLE_CHART))
+        export_records(self.connection, records + records, batch_size=4)
+        self.assertEqual(self.count('starter_performance_data'), 6)
+        export_files(self.connection, [SAMPLE_CHART, SAMPLE_CHART], workers=1)
+        self.assertEqual(self.count('race_data'), 2)
+        self.assertEqual(self.count('starter_performance_data'), 6)
+        self.assertEqual(self.count('foot_notes'), 3)
+
+    def test_code_members(self):
+        export_records(self.connection, iter_records(SAMPLE_CHART, plans=coded_plans()))
+        surfaces = {row[0] for row in self.connection.execute('SELECT surface FROM race_data')}
+        self.assertEqual(surfaces, {record.surface for record in iter_records(SAMPLE_CHART, record_types='R')})
+
+    def test_export_files(self):
+        counts = export_files(self.connection, [SAMPLE_CHART], workers=1)
+        self.assertEqual(counts['race_data'], 2)
@@ -0,0 +1,78 @@
+#! python3
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from pydrf import follow
+from pydrf.follow import ChartFollower, FollowEventType
+
+
+SAMPLE_CHART = os.path.join(os.path.dirname(__file__), 'data', 'sample_chart.txt')
+
+
+class ChartFollowerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'chart.txt')
+        self.checkpoint = os.path.join(self.directory, 'chart.checkpoint')
+        with open(SAMPLE_CHART, 'rb') as file:
+            self.lines = file.read().splitlines(keepends=True)
+        self.lines[1] = self.lines[1].replace(b'"Y"\r\n', b'""\r\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, lines, mode='wb'):
+        with open(self.path, mode) as file:
+            file.writelines(lines)
+
+    def kinds(self, events):
+        return [(event.kind, event.race_number) for event in events]
+
+    def test_follow(self):
+        self.write(self.lines[:5] + [self.lines[5][:10]])
+        follower = ChartFollower(self.path, self.checkpoint)
+        self.assertEqual(self.kinds(follower.poll()), [(FollowEventType.NEW_RACE, 1)]
+                         + [(FollowEventType.NEW_STARTER, 1)] * 3)
+        self.assertEqual(follower.poll(), [])
+
+        self.write(self.lines[:5] + self.lines[5:])
+        events = follower.poll()
+        self.assertEqual(self.kinds(events), [(FollowEventType.NEW_RACE, 2), (FollowEventType.RACE_OFFICIAL, 2)]
+                         + [(FollowEventType.NEW_STARTER, 2)] * 3)
+
+        self.lines[1] = self.lines[1].replace(b'""\r\n', b'"Y"\r\n')
+        self.lines[3] = self.lines[3].replace(b'"Bravo"', b'"Bravo Two"')
+        self.write(self.lines)
+        events = follower.poll()
+        self.assertEqual(self.kinds(events), [(FollowEventType.RACE_OFFICIAL, 1), (FollowEventType.STARTER_UPDATED, 1)])
+        self.assertEqual(events[1].record.horse_name, 'Bravo Two')
+
+        resumed = ChartFollower(self.path, self.checkpoint)
+        self.assertEqual(resumed.offset, os.path.getsize(self.path))
+        self.assertEqual(resumed.poll(), [])
+        self.write([b'"F",2,3,"Late note."\r\n'], 'ab')
+        self.assertEqual(resumed.poll(), [])
+        self.assertEqual(resumed.offset, os.path.getsize(self.path))
+
+    def test_tail_window(self):
+        foxtrot = next(index for index, line in enumerate(self.lines) if b'"Foxtrot"' in line)
+        self.write(self.lines[:foxtrot + 1])
+        follower = ChartFollower(self.path)
+        follower.poll()
+        self.lines[foxtrot] = self.lines[foxtrot].replace(b'"Foxtrot"', b'"Foxtrox"')
+        self.write(self.lines[:foxtrot + 1])
+        self.assertEqual(self.kinds(follower.poll()), [(FollowEventType.STARTER_UPDATED, 2)])
+        self.write([b'"F",2,9,"' + b'x' * 1000 + b'"\r\n'] * (2 * follow.TAIL_SIZE // 1000), 'ab')
+        follower.poll()
+        reads = []
+        read_tail = follower.read_tail
+        follower.read_tail = lambda file: reads.append(read_tail(file)) or reads[-1]
+        self.write([b'"F",2,3,"Late note."\r\n'], 'ab')
+        self.assertEqual(follower.poll(), [])
+        self.assertEqual([len(tail) for tail in reads], [follow.TAIL_SIZE])
+        self.assertEqual(follower.offset, os.path.getsize(self.path))
@@ -0,0 +1,61 @@
+#! python3
+
+
+import io
+import math
+import os
+import unittest
+
+from pydrf.history import FEATURES, HorseHistory
+from pydrf.races import iter_races
+from pydrf.store import RaceKey
+
+
+SAMPLE_CHART = os.path.join(os.path.dirname(__file__), 'data', 'sample_chart.txt')
+
+
+class HorseHistoryTestCase(unittest.TestCase):
+
+    def setUp(self):
+        with open(SAMPLE_CHART, newline='', encoding='latin-1') as file:
+            self.text = file.read()
+        self.history = HorseHistory(depth=2)
+        for day in ('20250801', '20250815', '20250808'):
+            self.history.add_file(self.chart(day))
+
+    def chart(self, day: str) -> io.StringIO:
+        return io.StringIO(self.text.replace('20250801', day), newline='')
+
+    def test_bounded_depth(self):
+        starts = self.history.starts('1001')
+        self.assertEqual([key.race_date for key, _ in starts], ['20250808', '20250815'])
+        self.assertEqual(starts[0][1][FEATURES.index('odds')], 2.5)
+        self.history.add_file(self.chart('20250701'))
+        self.assertEqual(len(self.history.starts('1001')), 2)
+        self.history.add_file(self.chart('20250815'))
+        self.assertEqual(len(self.history.starts('1001')), 2)
+
+    def test_horse_matrix(self):
+        matrix = self.history.horse_matrix(['1001', '9999'], before=RaceKey('20250815', 'SAR', 1))
+        self.assertEqual(matrix.shape, (2, 2, len(FEATURES)))
+        self.assertEqual(list(matrix.counts), [1, 0])
+        self.assertEqual(len(matrix.values), 2 * 2 * len(FEATURES))
+        odds = FEATURES.index('odds')
+        self.assertEqual(matrix.values[odds], 2.5)
+        self.assertTrue(all(math.isnan(value) for value in matrix.values[len(FEATURES):]))
+        latest = self.history.horse_matrix(['1001'])
+        self.assertEqual(list(latest.counts), [2])
+
+    def test_card_matrix(self):
+        races = list(iter_races(self.chart('20250815')))
+        matrix = self.history.card_matrix(races)
+        self.assertEqual([horse for horse, _ in matrix.entries], ['1001', '1002', '1003', '1004', '1005', '1006'])
+        self.assertEqual(list(matrix.counts), [1] * 6)
+        self.assertEqual(matrix.entries[0][1], RaceKey('20250815', 'SAR', 1))
+
+    def test_max_horses(self):
+        history = HorseHistory(max_horses=4)
+        history.add_file(self.chart('20250801'))
+        self.assertEqual(len(history), 4)
+        self.assertEqual(history.starts('1001'), [])
+        self.assertEqual(len(history.starts('1006')), 1)
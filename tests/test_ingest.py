@@ -0,0 +1,42 @@
+#! python3
+
+
+import os
+import unittest
+from collections import Counter
+
+from pydrf.ingest import iter_file_records, map_files, reduce_files
+from pydrf.textchart import StarterPerformanceData, iter_records
+
+
+SAMPLE_CHART = os.path.join(os.path.dirname(__file__), 'data', 'sample_chart.txt')
+
+
+def count_winners(path) -> Counter:
+    return Counter(record.horse_key for record in iter_records(path)
+                   if isinstance(record, StarterPerformanceData) and record.official_finish == 1)
+
+
+class IngestTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.paths = [SAMPLE_CHART] * 4
+        self.records = list(iter_records(SAMPLE_CHART))
+
+    def test_map_files(self):
+        results = list(map_files(self.paths, count_winners, workers=2))
+        self.assertEqual([path for path, _ in results], self.paths)
+        self.assertEqual(results[0][1], Counter({'1001': 1, '1005': 1}))
+
+    def test_merged_stream(self):
+        for workers in (1, 2):
+            records = list(iter_file_records(self.paths, workers=workers, chunksize=2))
+            self.assertEqual(repr(records), repr(self.records * 4))
+
+    def test_reduce_files(self):
+        total = reduce_files(self.paths, count_winners, Counter.__add__, Counter(), workers=2)
+        self.assertEqual(total, Counter({'1001': 4, '1005': 4}))
+
+    def test_packed_stream(self):
+        records = list(iter_file_records(self.paths, workers=2, packed=True))
+        self.assertEqual(repr(records), repr(self.records * 4))
@@ -0,0 +1,84 @@
+#! python3
+
+
+import io
+import json
+import math
+import os
+import unittest
+from collections import Counter
+
+from pydrf.instrument import ParseStats, iter_instrumented_records
+from pydrf.synthetic import write_synthetic_charts
+from pydrf.textchart import StarterPerformanceDataIndex, iter_records, iter_rows
+
+
+SAMPLE_CHART = os.path.join(os.path.dirname(__file__), 'data', 'sample_chart.txt')
+
+
+class ParseStatsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.stats = ParseStats()
+
+    def test_records_match_uninstrumented(self):
+        records = list(iter_instrumented_records(SAMPLE_CHART, self.stats))
+        self.assertEqual(repr(records), repr(list(iter_records(SAMPLE_CHART))))
+        compact = list(iter_instrumented_records(SAMPLE_CHART, ParseStats(), compact=True))
+        self.assertEqual(repr(compact), repr(list(iter_records(SAMPLE_CHART, compact=True))))
+
+    def test_rows_per_record_type(self):
+        list(iter_instrumented_records(SAMPLE_CHART, self.stats))
+        snapshot = self.stats.snapshot()
+        types = snapshot['record_types']
+        self.assertEqual(types['HEADER']['rows'], 1)
+        self.assertEqual(types['STARTER']['rows'], 6)
+        self.assertEqual(types['EXOTIC_WAGERING']['rows'], 2)
+        self.assertGreater(types['STARTER']['seconds'], 0)
+        self.assertEqual(snapshot['fallbacks'], {})
+        self.assertGreater(snapshot['blanks']['RaceData.fraction4'], 0)
+        json.dumps(snapshot)
+
+    def test_fallbacks_and_widths(self):
+        rows = list(iter_rows(SAMPLE_CHART))
+        starter = next(row for row in rows if row[0] == 'S')
+        bad = list(starter)
+        bad[StarterPerformanceDataIndex.ODDS_INDEX.value] = 'n/a'
+        lines = io.StringIO()
+        for row in (bad, starter + ['extra'], ['Z', 'unknown']):
+            lines.write(','.join(f'"{value}"' for value in row) + '\r\n')
+        lines.seek(0)
+        records = list(iter_instrumented_records(lines, self.stats))
+        self.assertEqual(len(records), 2)
+        self.assertTrue(math.isnan(records[0].odds))
+        self.assertEqual(self.stats.fallbacks['StarterPerformanceData.odds'], 1)
+        self.assertEqual(self.stats.overlong_rows['S'], 1)
+        self.assertEqual(self.stats.unknown_rows['Z'], 1)
+
+    def test_clean_widths(self):
+        list(iter_instrumented_records(SAMPLE_CHART, self.stats))
+        file = io.StringIO(newline='')
+        write_synthetic_charts(file, charts=2, seed=5)
+        file.seek(0)
+        list(iter_instrumented_records(file, self.stats))
+        self.assertGreater(self.stats.rows['A'], 2)
+        self.assertEqual(+self.stats.short_rows, Counter())
+        self.assertEqual(+self.stats.overlong_rows, Counter())
+
+    def test_short_rows(self):
+        starter = next(row for row in iter_rows(SAMPLE_CHART) if row[0] == 'S')
+        lines = io.StringIO()
+        for row in (starter[:10], starter):
+            lines.write(','.join(f'"{value}"' for value in row) + '\r\n')
+        lines.seek(0)
+        records = list(iter_instrumented_records(lines, self.stats))
+        self.assertEqual([record.horse_key for record in records], ['1001'])
+        self.assertEqual(self.stats.short_rows['S'], 1)
+        self.assertEqual(self.stats.rows['S'], 1)
+
+    def test_merge(self):
+        list(iter_instrumented_records(SAMPLE_CHART, self.stats))
+        other = ParseStats()
+        list(iter_instrumented_records(SAMPLE_CHART, other))
+        self.stats.merge(other)
+        self.assertEqual(self.stats.rows['S'], 12)
@@ -0,0 +1,40 @@
+#! python3
+
+
+import os
+import unittest
+
+from pydrf.lazy import LazyRaceData, LazyStarterPerformanceData, iter_lazy_records
+from pydrf.textchart import iter_records, iter_rows
+
+
+SAMPLE_CHART = os.path.join(os.path.dirname(__file__), 'data', 'sample_chart.txt')
+
+
+class LazyRecordTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.lazy = list(iter_lazy_records(SAMPLE_CHART))
+        self.records = list(iter_records(SAMPLE_CHART))
+
+    def test_decodes_on_access(self):
+        starter = self.lazy[2]
+        self.assertIsInstance(starter, LazyStarterPerformanceData)
+        self.assertEqual(starter.__dict__, {})
+        self.assertEqual(starter.official_finish, 1)
+        self.assertEqual(starter.win_payoff, 7.0)
+        self.assertEqual(set(starter.__dict__), {'official_finish', 'win_payoff'})
+        self.assertIsInstance(self.lazy[1], LazyRaceData)
+        self.assertEqual(self.lazy[1].fraction1, 22.34)
+
+    def test_materialize(self):
+        self.assertEqual(len(self.lazy), len(self.records))
+        for lazy, record in zip(self.lazy, self.records):
+            self.assertEqual(repr(lazy.materialize()), repr(record))
+            for name in lazy.plan.fields:
+                self.assertEqual(repr(getattr(lazy, name)), repr(getattr(record, name)))
+
+    def test_equality(self):
+        rows = [row for row in iter_rows(SAMPLE_CHART) if row[0] == 'S']
+        self.assertEqual(LazyStarterPerformanceData(list(rows[0])), LazyStarterPerformanceData(list(rows[0])))
+        self.assertNotEqual(LazyStarterPerformanceData(rows[0]), LazyStarterPerformanceData(rows[1]))
@@ -0,0 +1,51 @@
+#! python3
+
+
+import io
+import os
+import tempfile
+import unittest
+
+from pydrf.manifest import RaceManifest, iter_changed_races
+
+
+SAMPLE_CHART = os.path.join(os.path.dirname(__file__), 'data', 'sample_chart.txt')
+
+
+class RaceManifestTestCase(unittest.TestCase):
+
+    def setUp(self):
+        with open(SAMPLE_CHART, newline='', encoding='latin-1') as file:
+            self.text = file.read()
+
+    def races(self, text: str, manifest: RaceManifest) -> list[int]:
+        return [race.race_number for race in iter_changed_races(io.StringIO(text, newline=''), manifest)]
+
+    def test_unchanged_races_are_skipped(self):
+        manifest = RaceManifest()
+        self.assertEqual(self.races(self.text, manifest), [1, 2])
+        self.assertEqual(len(manifest), 2)
+        self.assertEqual(self.races(self.text, manifest), [])
+
+    def test_changed_race_is_emitted(self):
+        manifest = RaceManifest()
+        self.races(self.text, manifest)
+        corrected = self.text.replace('"Delta"', '"Delta (IRE)"')
+        races = list(iter_changed_races(io.StringIO(corrected, newline=''), manifest))
+        self.assertEqual([race.race_number for race in races], [2])
+        self.assertEqual(races[0].header.track_code, 'SAR')
+        self.assertEqual(races[0].starters[0].horse_name, 'Delta (IRE)')
+        self.assertEqual(len(races[0].foot_notes), 2)
+        self.assertEqual(self.races(corrected, manifest), [])
+
+    def test_footnotes_are_not_fingerprinted(self):
+        manifest = RaceManifest()
+        self.races(self.text, manifest)
+        self.assertEqual(self.races(self.text.replace('DELTA set the pace.', 'DELTA led.'), manifest), [])
+
+    def test_persisted_manifest(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'manifest.json')
+            self.assertEqual(self.races(self.text, RaceManifest(path)), [1, 2])
+            self.assertTrue(os.path.exists(path))
+            self.assertEqual(self.races(self.text, RaceManifest(path)), [])
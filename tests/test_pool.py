@@ -0,0 +1,60 @@
+#! python3
+
+
+import os
+import unittest
+from array import array
+
+from pydrf.pool import StringPool, pooled_plans
+from pydrf.table import StarterTable
+from pydrf.textchart import StarterPerformanceData, iter_records, iter_rows
+
+
+SAMPLE_CHART = os.path.join(os.path.dirname(__file__), 'data', 'sample_chart.txt')
+
+
+class StringPoolTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = StringPool()
+        self.records = list(iter_records(SAMPLE_CHART))
+
+    def test_encode(self):
+        first = self.pool.encode('Pletcher')
+        self.assertEqual(self.pool.encode('Pletcher'), first)
+        self.assertNotEqual(self.pool.encode('Brown'), first)
+        self.assertEqual(self.pool.decode(first), 'Pletcher')
+        self.assertEqual(self.pool.code('Brown'), 1)
+        self.assertIsNone(self.pool.code('Cox'))
+        report = self.pool.report()
+        self.assertEqual((report.unique, report.references), (2, 3))
+        self.assertGreater(report.saved_bytes, 0)
+
+    def test_interned_records(self):
+        pooled = list(iter_records(SAMPLE_CHART, plans=pooled_plans(self.pool)))
+        self.assertEqual(repr(pooled), repr(self.records))
+        starters = [record for record in pooled if isinstance(record, StarterPerformanceData)]
+        self.assertTrue(all(starter.trainer_last_name is starters[0].trainer_last_name for starter in starters))
+        self.assertIsNot(starters[0].long_comments, starters[1].long_comments)
+        self.assertGreater(self.pool.report().saved_bytes, 0)
+
+    def test_encoded_table(self):
+        table = StarterTable.from_rows(iter_rows(SAMPLE_CHART), self.pool)
+        self.assertIsInstance(table.columns['jockey_last_name'], array)
+        self.assertNotIn('jockey_last_name', table.numeric_fields())
+        self.assertIn('jockey_last_name', table.string_fields())
+        self.assertIsInstance(table.columns['long_comments'], list)
+        code = table.code('horse_name', 'Echo')
+        self.assertEqual([index for index, value in enumerate(table.columns['horse_name']) if value == code], [4])
+        starters = [record for record in self.records if isinstance(record, StarterPerformanceData)]
+        self.assertEqual(repr(table.to_records()), repr(starters))
+        self.assertEqual(repr(table.record(2)), repr(starters[2]))
+        winners = table.where('horse_name', lambda name: name in ('Alpha', 'Echo'))
+        self.assertEqual(winners.values('horse_name'), ['Alpha', 'Echo'])
+        with self.assertRaises(ValueError):
+            winners.extend(StarterTable.from_rows(iter_rows(SAMPLE_CHART)))
+        self.assertEqual(table.where('horse_name', 'Echo').values('horse_key'), ['1005'])
+        self.assertEqual(len(table.where('horse_name', 'Unknown')), 0)
+        combined = StarterTable.concat([table, winners])
+        self.assertIs(combined.pool, self.pool)
+        self.assertEqual(combined.values('horse_name')[-2:], ['Alpha', 'Echo'])
@@ -0,0 +1,42 @@
+#! python3
+
+
+import os
+import unittest
+
+from pydrf.races import assemble_races, iter_races
+from pydrf.textchart import AttendanceAndHandleData, iter_records
+
+
+SAMPLE_CHART = os.path.join(os.path.dirname(__file__), 'data', 'sample_chart.txt')
+
+
+class RaceAssemblyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.races = list(iter_races(SAMPLE_CHART))
+
+    def test_races(self):
+        self.assertEqual([race.race_number for race in self.races], [1, 2])
+        first, second = self.races
+        self.assertEqual(first.header.track_code, 'SAR')
+        self.assertIs(first.header, second.header)
+        self.assertEqual(first.race.race_name, 'Claiming')
+        self.assertEqual([starter.horse_name for starter in first.starters], ['Alpha', 'Bravo', 'Charlie'])
+        self.assertEqual(first.exotic_wagering[0].wager_type, 'EX')
+        self.assertEqual(first.attendance[0].attendance, 12000)
+        self.assertEqual(first.comments[0].comment_text, 'Alpha claimed by Smith')
+        self.assertEqual([note.sequence_number for note in second.foot_notes], [1, 2])
+        self.assertEqual(second.foot_notes[1].text, 'DELTA set the pace.')
+
+    def test_compact(self):
+        races = list(iter_races(SAMPLE_CHART, compact=True))
+        self.assertEqual([len(race.starters) for race in races], [3, 3])
+
+    def test_unmatched_rows(self):
+        records = list(iter_records(SAMPLE_CHART))
+        records.append(AttendanceAndHandleData(0, 'T', 'SAR', 24500, 5250000.5))
+        races = list(assemble_races(records))
+        self.assertEqual([race.race_number for race in races], [1, 2, 0])
+        self.assertIsNone(races[2].race)
+        self.assertEqual(races[2].attendance[0].attendance, 24500)
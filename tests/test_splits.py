@@ -0,0 +1,57 @@
+#! python3
+
+
+import math
+import os
+import unittest
+
+from pydrf import splits
+from pydrf.splits import card_split_times, final_times_to_seconds, fractions_to_seconds, split_times
+from pydrf.textchart import final_time_to_seconds, fraction_to_seconds, iter_rows
+
+
+SAMPLE_CHART = os.path.join(os.path.dirname(__file__), 'data', 'sample_chart.txt')
+
+
+def same(left, right) -> bool:
+    return left == right or (math.isnan(left) and math.isnan(right))
+
+
+class SplitTimesTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.rows = list(iter_rows(SAMPLE_CHART))
+
+    def test_scalar_conversions(self):
+        fractions = [2234.0, 4567.0, 11012.0, 13456.0, 5999.0, float('nan')]
+        finals = [110.45, 141.2, 59.99, 201.07, float('nan')]
+        for value, seconds in zip(fractions, fractions_to_seconds(fractions, use_numpy=False)):
+            self.assertTrue(same(seconds, fraction_to_seconds(value)))
+        for value, seconds in zip(finals, final_times_to_seconds(finals, use_numpy=False)):
+            self.assertTrue(same(seconds, final_time_to_seconds(value)))
+
+    def test_card_split_times(self):
+        result = card_split_times(self.rows, use_numpy=False)
+        self.assertEqual(result.races, [(0, 1), (0, 2)])
+        self.assertEqual(result.race_index, [0, 0, 0, 1, 1, 1])
+        self.assertEqual([key for _, _, key in result.starters], ['1001', '1002', '1003', '1004', '1005', '1006'])
+        self.assertEqual(result.race_times[0][:3], [22.34, 45.67, 58.12])
+        self.assertTrue(math.isnan(result.race_times[0][3]))
+        self.assertEqual(result.race_times[0][5], 70.45)
+        self.assertAlmostEqual(result.starter_times[1][0], 22.34 + 1.5 * 0.2)
+        self.assertAlmostEqual(result.starter_times[2][5], 70.45 + 3.25 * 0.2)
+        self.assertEqual(result.starter_times[4][5], 101.2)
+
+    def test_seconds_per_length(self):
+        result = split_times([[10.0, 20.0]], [0, 0], [[0.0, 1.0], [2.0, 3.0]], seconds_per_length=0.25,
+                             use_numpy=False)
+        self.assertEqual(result, [[10.0, 20.25], [10.5, 20.75]])
+
+    @unittest.skipIf(splits.numpy is None, 'NumPy is not installed')
+    def test_numpy_matches_fallback(self):
+        vectorized = card_split_times(self.rows * 3)
+        fallback = card_split_times(self.rows * 3, use_numpy=False)
+        for fast, slow in ((vectorized.race_times, fallback.race_times),
+                           (vectorized.starter_times, fallback.starter_times)):
+            for fast_row, slow_row in zip(fast.tolist(), slow):
+                self.assertTrue(all(same(left, right) for left, right in zip(fast_row, slow_row)))
@@ -0,0 +1,113 @@
+#! python3
+
+
+import io
+import math
+import os
+import tempfile
+import unittest
+from dataclasses import replace
+
+from pydrf.stats import ConnectionStats, Tally, collect_stats
+from pydrf.store import RaceKey
+from pydrf.textchart import StarterPerformanceData, iter_records
+
+
+SAMPLE_CHART = os.path.join(os.path.dirname(__file__), 'data', 'sample_chart.txt')
+
+
+class ConnectionStatsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        with open(SAMPLE_CHART, newline='', encoding='latin-1') as file:
+            self.text = file.read()
+
+    def chart(self, day: str) -> io.StringIO:
+        return io.StringIO(self.text.replace('20250801', day), newline='')
+
+    def partial(self, *days: str) -> ConnectionStats:
+        stats = ConnectionStats()
+        for day in days:
+            stats.add_file(self.chart(day))
+        return stats
+
+    def test_tally(self):
+        stats = self.partial('20250801')
+        jockey = stats.query('jockey', 501)
+        self.assertEqual((jockey.starts, jockey.wins, jockey.in_the_money), (2, 1, 2))
+        self.assertEqual(jockey.win_roi, 0.75)
+        self.assertAlmostEqual(jockey.place_return, 7.0)
+        trainer = stats.query('trainer', 901)
+        self.assertEqual((trainer.starts, trainer.wins, trainer.in_the_money), (3, 1, 3))
+        self.assertAlmostEqual(trainer.win_percent, 100 / 3)
+        self.assertEqual(stats.query('owner', 'Mike Repole').starts, 6)
+        self.assertTrue(math.isnan(Tally().win_roi))
+
+    def test_windows_and_merge(self):
+        merged = self.partial('20250801').merge(self.partial('20250808', '20250815'))
+        self.assertEqual(merged.query('jockey', 501).starts, 6)
+        self.assertEqual(merged.query('jockey', 501, '20250805').starts, 4)
+        self.assertEqual(merged.query('jockey', 501, '20250805', '20250810').wins, 1)
+        self.assertEqual(merged.query('jockey', 999).starts, 0)
+        leaders = merged.leaders('trainer', minimum_starts=6)
+        self.assertEqual([key for key, _ in leaders], [902, 901])
+        self.assertEqual(leaders[1][1].starts, 9)
+
+    def corrected(self) -> list:
+        records = []
+        for record in iter_records(self.chart('20250801')):
+            if isinstance(record, StarterPerformanceData) and record.horse_key == '1001':
+                record = replace(record, official_finish=4, win_payoff=math.nan, place_payoff=math.nan,
+                                 show_payoff=math.nan)
+            records.append(record)
+        return records
+
+    def test_resent_races_replace_earlier_charts(self):
+        stats = self.partial('20250801', '20250801')
+        self.assertEqual(stats.query('jockey', 501).starts, 2)
+        stats.add_chart(self.corrected())
+        jockey = stats.query('jockey', 501)
+        self.assertEqual((jockey.starts, jockey.wins, jockey.in_the_money), (2, 0, 1))
+        self.assertAlmostEqual(jockey.win_return, 0.0)
+        self.assertEqual(stats.query('trainer', 901).wins, 0)
+        corrected = ConnectionStats()
+        corrected.add_chart(self.corrected())
+        merged = self.partial('20250801', '20250808').merge(corrected)
+        self.assertEqual(merged.query('jockey', 501).starts, 4)
+        self.assertEqual(merged.query('jockey', 501, end_date='20250801').wins, 0)
+        self.assertEqual(len(merged.races), 4)
+        stats = self.partial('20250801')
+        stats.add_chart(iter_records(self.chart('20250801'), where={'race_number': 2}))
+        self.assertEqual(stats.query('jockey', 501).starts, 2)
+        self.assertEqual(stats.query('trainer', 902).starts, 2)
+
+    def test_merge_order_and_independence(self):
+        corrected = ConnectionStats()
+        corrected.add_chart(self.corrected())
+        merged = self.partial('20250801').merge(corrected)
+        self.assertEqual(merged.query('jockey', 501).wins, 0)
+        corrected = ConnectionStats()
+        corrected.add_chart(self.corrected())
+        reverse = corrected.merge(self.partial('20250801'))
+        self.assertEqual(reverse.query('jockey', 501).wins, 1)
+        other = self.partial('20250808')
+        merged = self.partial('20250801').merge(other)
+        delta = next(record for record in iter_records(self.chart('20250808'))
+                     if isinstance(record, StarterPerformanceData) and record.horse_key == '1004')
+        key = RaceKey('20250808', 'SAR', 2)
+        merged.add_starter(key, delta)
+        other.remove_race(key)
+        self.assertEqual(other.query('jockey', 501).starts, 1)
+        self.assertEqual(merged.query('jockey', 501).starts, 5)
+
+    def test_collect_stats(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for day in ('20250801', '20250808', '20250815', '20250801'):
+                paths.append(os.path.join(directory, f'{len(paths)}-{day}.txt'))
+                with open(paths[-1], 'w', newline='', encoding='latin-1') as file:
+                    file.write(self.chart(day).getvalue())
+            stats = collect_stats(paths, workers=2)
+        self.assertEqual(len(stats.races), 6)
+        self.assertEqual(stats.query('owner', 'Mike Repole', end_date='20250808').starts, 12)
+        self.assertEqual(sorted(stats.keys('jockey')), [501, 502, 503, 504, 505])
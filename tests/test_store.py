@@ -0,0 +1,46 @@
+#! python3
+
+
+import os
+import unittest
+
+from pydrf.store import ChartStore, RaceKey
+from pydrf.textchart import Header, iter_records
+
+
+SAMPLE_CHART = os.path.join(os.path.dirname(__file__), 'data', 'sample_chart.txt')
+
+
+class ChartStoreTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.store = ChartStore()
+        self.store.add_file(SAMPLE_CHART)
+
+    def test_point_lookups(self):
+        self.assertEqual(len(self.store), 2)
+        self.assertEqual(self.store.race('SAR', '20250801', 2).surface, 'T')
+        self.assertIsNone(self.store.race('SAR', '20250801', 3))
+        self.assertEqual([starter.horse_name for starter in self.store.race_starters('SAR', '20250801', 1)],
+                         ['Alpha', 'Bravo', 'Charlie'])
+        self.assertEqual([start.starter.horse_name for start in self.store.trainer(901)],
+                         ['Alpha', 'Charlie', 'Foxtrot'])
+        self.assertEqual([start.key.race_number for start in self.store.jockey(501)], [1, 2])
+        self.assertEqual(self.store.horse('1005')[0].starter.official_finish, 1)
+
+    def test_incremental_add(self):
+        records = list(iter_records(SAMPLE_CHART))
+        records[0] = Header('USA', 'SAR', '20250720', 2, 'D', 'SAR')
+        self.store.add_chart(records)
+        self.assertEqual(len(self.store), 4)
+        self.assertEqual([start.key.race_date for start in self.store.horse('1001')], ['20250720', '20250801'])
+        self.assertEqual(self.store.races_between('20250701', '20250731'),
+                         [RaceKey('20250720', 'SAR', 1), RaceKey('20250720', 'SAR', 2)])
+        self.assertEqual(len(self.store.races_between('20250720', '20250801')), 4)
+
+    def test_replace_race(self):
+        self.store.add_file(SAMPLE_CHART)
+        self.assertEqual(len(self.store), 2)
+        self.assertEqual(len(self.store.race_starters('SAR', '20250801', 1)), 3)
+        self.assertEqual(len(self.store.trainer(901)), 3)
+        self.assertEqual(len(self.store.dates), 2)
@@ -0,0 +1,56 @@
+#! python3
+
+
+import io
+import unittest
+from collections import Counter
+
+from pydrf.synthetic import ChartGenerator, iter_synthetic_rows, write_synthetic_charts
+from pydrf.textchart import (PLANS, HeaderIndex, RecordType, StarterPerformanceData, StarterPerformanceDataIndex,
+                             iter_records)
+
+
+WIDTHS = {'H': 7, 'R': 64, 'S': 92, 'E': 9, 'A': 8, 'C': 9, 'F': 4}
+
+
+class SyntheticChartTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.rows = list(iter_synthetic_rows(charts=3, seed=7))
+
+    def test_same_seed_is_deterministic(self):
+        self.assertEqual(self.rows, list(iter_synthetic_rows(charts=3, seed=7)))
+        self.assertNotEqual(self.rows, list(iter_synthetic_rows(charts=3, seed=8)))
+
+    def test_row_widths(self):
+        for row in self.rows:
+            self.assertIn(row[0], PLANS)
+            self.assertEqual(WIDTHS[row[0]], len(row), row[0])
+
+    def test_starters_per_race(self):
+        race_number = StarterPerformanceDataIndex.RACE_NUMBER_INDEX.value
+        chart = -1
+        starters = Counter()
+        for row in self.rows:
+            if row[0] == RecordType.HEADER.value:
+                chart += 1
+            elif row[0] == RecordType.STARTER.value:
+                starters[(chart, row[race_number])] += 1
+        self.assertTrue(starters)
+        for count in starters.values():
+            self.assertTrue(5 <= count <= 14)
+
+    def test_header_counts_races(self):
+        chart = ChartGenerator(seed=1).chart('SAR', '20250801')
+        races = [row for row in chart if row[0] == RecordType.RACE.value]
+        self.assertEqual(len(races), chart[0][HeaderIndex.NUMBER_OF_RACES_INDEX.value])
+
+    def test_written_charts_parse(self):
+        file = io.StringIO(newline='')
+        write_synthetic_charts(file, charts=3, seed=7)
+        file.seek(0)
+        records = list(iter_records(file))
+        self.assertEqual(len(self.rows), len(records))
+        starters = [record for record in records if isinstance(record, StarterPerformanceData)]
+        self.assertTrue(starters)
+        self.assertTrue(all(record.horse_name for record in starters))
@@ -0,0 +1,54 @@
+#! python3
+
+
+import os
+import unittest
+from array import array
+
+from pydrf.table import StarterTable
+from pydrf.textchart import StarterPerformanceData, iter_records, iter_rows
+
+
+SAMPLE_CHART = os.path.join(os.path.dirname(__file__), 'data', 'sample_chart.txt')
+
+
+class StarterTableTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.table = StarterTable.from_rows(iter_rows(SAMPLE_CHART))
+        self.starters = [record for record in iter_records(SAMPLE_CHART)
+                         if isinstance(record, StarterPerformanceData)]
+
+    def test_columns(self):
+        self.assertEqual(len(self.table), 6)
+        self.assertIsInstance(self.table.columns['odds'], array)
+        self.assertEqual(self.table.columns['odds'].typecode, 'd')
+        self.assertEqual(self.table.columns['official_finish'].typecode, 'q')
+        self.assertIsInstance(self.table.columns['horse_name'], list)
+        self.assertIn('odds', self.table.numeric_fields())
+        self.assertIn('horse_key', self.table.string_fields())
+        self.assertEqual(list(self.table['official_finish']), [1, 2, 3, 2, 1, 3])
+
+    def test_round_trip(self):
+        self.assertEqual(repr(self.table.to_records()), repr(self.starters))
+        self.assertEqual(repr(self.table.record(4)), repr(self.starters[4]))
+        self.assertEqual(repr(StarterTable.from_records(self.starters).to_records()), repr(self.starters))
+
+    def test_take_and_concat(self):
+        self.assertEqual(len(self.table.where('official_finish', 1)), 2)
+        winners = self.table.where('official_finish', lambda finish: finish == 1)
+        self.assertEqual(winners.columns['horse_name'], ['Alpha', 'Echo'])
+        self.assertEqual(list(winners.columns['win_payoff']), [7.0, 14.6])
+        combined = StarterTable.concat([self.table, winners])
+        self.assertEqual(len(combined), 8)
+        self.assertEqual(combined.columns['horse_name'][-1], 'Echo')
+
+    def test_extend_while_indexed(self):
+        odds = self.table['odds']
+        view = memoryview(self.table.columns['official_finish'])
+        self.table.extend(StarterTable.from_rows(iter_rows(SAMPLE_CHART)))
+        self.assertEqual(len(self.table), 12)
+        self.assertEqual(list(self.table['official_finish']), [1, 2, 3, 2, 1, 3] * 2)
+        self.assertEqual(list(view), [1, 2, 3, 2, 1, 3])
+        self.assertEqual(odds[0], 2.5)
+        self.assertEqual(len(StarterTable.concat([self.table, self.table])), 24)
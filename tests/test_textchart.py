@@ -1,13 +1,154 @@
 #! python3
 
 
+import io
+import math
+import os
+import pickle
 import unittest
+from dataclasses import astuple
+
+from pydrf.textchart import (CODE_FIELDS, PLANS, AttendanceAndHandleData, BreedIndicator,
+                             CommentsAndRaceOdditiesData, CompactStarterPerformanceData, CourseCodes,
+                             ExoticWageringData, FootNotes, Header, RaceData, RecordType, RestrictionCodes,
+                             SexRestrictions, StarterPerformanceData, SurfaceCodes, UnknownCodeError, code_converter,
+                             coded_plans, fraction_to_seconds, iter_records, iter_rows)
+
+
+SAMPLE_CHART = os.path.join(os.path.dirname(__file__), 'data', 'sample_chart.txt')
 
 
 class TextChartTestCase(unittest.TestCase):
 
     def setUp(self):
-        pass
+        self.records = list(iter_records(SAMPLE_CHART))
 
     def test_header(self):
-        pass
+        header = self.records[0]
+        self.assertIsInstance(header, Header)
+        self.assertEqual(header.track_code, 'SAR')
+        self.assertEqual(header.race_date, '20250801')
+        self.assertEqual(header.number_of_races, 2)
+
+    def test_record_types(self):
+        counts = {}
+        for record in self.records:
+            counts[type(record)] = counts.get(type(record), 0) + 1
+        self.assertEqual(counts, {
+            Header: 1,
+            RaceData: 2,
+            StarterPerformanceData: 6,
+            ExoticWageringData: 2,
+            AttendanceAndHandleData: 2,
+            CommentsAndRaceOdditiesData: 1,
+            FootNotes: 3,
+        })
+
+    def test_matches_factories(self):
+        rows = [row for row in iter_rows(SAMPLE_CHART) if row[0] == 'S']
+        starters = [record for record in self.records if isinstance(record, StarterPerformanceData)]
+        self.assertEqual(repr(starters), repr([StarterPerformanceData.create(row) for row in rows]))
+
+    def test_blank_fractions(self):
+        race = self.records[1]
+        self.assertEqual(race.fraction1, 22.34)
+        self.assertEqual(race.final_time, 70.45)
+        self.assertTrue(math.isnan(race.fraction4))
+        self.assertTrue(math.isnan(fraction_to_seconds(float('nan'))))
+
+    def test_file_object(self):
+        with open(SAMPLE_CHART, newline='') as file:
+            text = file.read()
+        self.assertEqual(len(list(iter_records(io.StringIO(text)))), len(self.records))
+
+    def test_plans_match_create(self):
+        for record_type, plan in PLANS.items():
+            row = [record_type] + [f'{column}{column % 10}' if column % 3 else f' x{column} '
+                                   for column in range(1, 100)]
+            numeric = [record_type] + [str(column) for column in range(1, 100)]
+            for values in (row, numeric):
+                for name, code in CODE_FIELDS.get(record_type, {}).items():
+                    values[plan.column(name)] = list(code)[-1].value
+                self.assertEqual(repr(plan.decode(values)), repr(plan.record_class.create(values)))
+
+    def test_compact_records(self):
+        compact = list(iter_records(SAMPLE_CHART, compact=True))
+        self.assertEqual(len(compact), len(self.records))
+        for regular, record in zip(self.records, compact):
+            self.assertEqual(type(record).__name__, f'Compact{type(regular).__name__}')
+            self.assertFalse(hasattr(record, '__dict__'))
+            self.assertEqual(repr(astuple(record)), repr(astuple(regular)))
+        starter = compact[2]
+        self.assertIsInstance(starter, CompactStarterPerformanceData)
+        self.assertEqual(starter.horse_name, 'Alpha')
+        self.assertEqual(starter, CompactStarterPerformanceData(*astuple(starter)))
+        self.assertNotEqual(starter, compact[3])
+        self.assertEqual(pickle.loads(pickle.dumps(starter)), starter)
+
+    def test_code_enums(self):
+        self.assertEqual(RecordType.RACE, 'R')
+        self.assertNotEqual(RecordType.RACE, RecordType.STARTER)
+        self.assertNotEqual(SurfaceCodes.DIRT, CourseCodes.DIRT)
+        self.assertEqual({'R': 'race'}[RecordType.RACE], 'race')
+        self.assertEqual({SurfaceCodes.TURF: 'turf'}['T'], 'turf')
+        self.assertIs(code_converter(BreedIndicator)('QH '), BreedIndicator.QUARTER_HORSE)
+        self.assertIs(code_converter(SexRestrictions)(''), SexRestrictions.OPEN)
+        self.assertIsNone(code_converter(RestrictionCodes)(''))
+        self.assertEqual(code_converter(SurfaceCodes, unknown='?')('X'), '?')
+        with self.assertRaises(UnknownCodeError):
+            code_converter(SurfaceCodes)('X')
+
+    def test_coded_plans(self):
+        races = [record for record in iter_records(SAMPLE_CHART, plans=coded_plans())
+                 if isinstance(record, RaceData)]
+        self.assertEqual(repr(races), repr(list(iter_records(SAMPLE_CHART, record_types='R'))))
+        self.assertIs(RaceData.create(next(row for row in iter_rows(SAMPLE_CHART) if row[0] == 'R')).surface,
+                      SurfaceCodes.DIRT)
+        self.assertIs(races[0].breed_indicator, BreedIndicator.THOROUGHBRED)
+        self.assertIs(races[0].sex_restriction, SexRestrictions.OPEN)
+        self.assertIsNone(races[0].restrictions)
+        self.assertEqual([race.surface for race in races], [SurfaceCodes.DIRT, SurfaceCodes.TURF])
+        self.assertIs(races[1].course_type, CourseCodes.INNER_TURF)
+        self.assertEqual(races[1].surface, 'T')
+        row = next(row for row in iter_rows(SAMPLE_CHART) if row[0] == 'R')
+        row[31] = 'X'
+        with self.assertRaises(UnknownCodeError):
+            coded_plans()['R'].decode(row)
+        with self.assertRaises(UnknownCodeError):
+            PLANS['R'].decode(row)
+        self.assertIsNone(coded_plans(unknown=None)['R'].decode(row).surface)
+
+    def test_record_type_filter(self):
+        records = list(iter_records(SAMPLE_CHART, record_types=(RecordType.RACE, 'S')))
+        self.assertEqual({type(record) for record in records}, {RaceData, StarterPerformanceData})
+        self.assertEqual(len(records), 8)
+        races = list(iter_records(SAMPLE_CHART, record_types=RecordType.RACE))
+        self.assertEqual(repr(races), repr(list(iter_records(SAMPLE_CHART, record_types='R'))))
+        self.assertEqual(len(races), 2)
+
+    def test_projection(self):
+        records = list(iter_records(SAMPLE_CHART, record_types='S',
+                                    fields={'S': ('race_number', 'horse_name', 'odds')}))
+        self.assertEqual([record.horse_name for record in records],
+                         ['Alpha', 'Bravo', 'Charlie', 'Delta', 'Echo', 'Foxtrot'])
+        self.assertEqual(records[0].odds, 2.5)
+        self.assertEqual(type(records[0]).__name__, 'StarterPerformanceDataProjection')
+        self.assertFalse(hasattr(records[0], 'jockey_last_name'))
+        narrow = list(iter_records(SAMPLE_CHART, record_types='S', fields={'S': ('horse_key',)}))
+        restored = pickle.loads(pickle.dumps((records, narrow)))
+        self.assertEqual(restored, (records, narrow))
+        self.assertIs(type(restored[1][0]), type(narrow[0]))
+        with self.assertRaises(KeyError):
+            list(iter_records(SAMPLE_CHART, fields={'S': ('unknown',)}))
+
+    def test_raw_predicates(self):
+        starters = list(iter_records(SAMPLE_CHART, record_types='S', where={'race_number': 2}))
+        self.assertEqual([starter.horse_name for starter in starters], ['Delta', 'Echo', 'Foxtrot'])
+        self.assertEqual(len(list(iter_records(SAMPLE_CHART, where={'track_code': {'CD', 'BEL'}}))), 0)
+        self.assertEqual(len(list(iter_records(SAMPLE_CHART, where={'track_code': 'SAR'}))),
+                         len(list(iter_records(SAMPLE_CHART))))
+        races = list(iter_records(SAMPLE_CHART, record_types='R',
+                                  where={'breed_indicator': lambda value: value == 'TB'}))
+        self.assertEqual(len(races), 2)
+        with self.assertRaises(KeyError):
+            list(iter_records(SAMPLE_CHART, where={'unknown': 1}))
@@ -0,0 +1,79 @@
+#! python3
+
+
+import gzip
+import io
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+import zipfile
+
+from pydrf.synthetic import write_synthetic_charts
+from pydrf.textchart import StarterPerformanceData, iter_records, projected_class
+from pydrf.threads import iter_chunks, iter_threaded_records
+
+
+SAMPLE_CHART = os.path.join(os.path.dirname(__file__), 'data', 'sample_chart.txt')
+
+
+class ThreadedRecordsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'synthetic.txt')
+        with open(self.path, 'w', newline='', encoding='latin-1') as file:
+            write_synthetic_charts(file, charts=4, seed=5)
+        self.records = repr(list(iter_records(self.path)))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_chunks_are_line_aligned(self):
+        with open(self.path, 'rb') as file:
+            data = file.read()
+        chunks = list(iter_chunks(io.BytesIO(data), chunk_size=1000))
+        self.assertGreater(len(chunks), 10)
+        self.assertEqual(b''.join(chunks), data)
+        self.assertTrue(all(chunk.endswith(b'\n') for chunk in chunks))
+
+    def test_matches_sequential_reader(self):
+        for workers in (1, 4):
+            records = list(iter_threaded_records(self.path, workers=workers, chunk_size=4096))
+            self.assertEqual(repr(records), self.records)
+
+    def test_archives(self):
+        gz = os.path.join(self.directory, 'synthetic.txt.gz')
+        with open(self.path, 'rb') as source, gzip.open(gz, 'wb') as target:
+            shutil.copyfileobj(source, target)
+        archive = os.path.join(self.directory, 'season.zip')
+        with zipfile.ZipFile(archive, 'w') as target:
+            target.write(self.path, 'a.txt')
+            target.write(SAMPLE_CHART, 'b.txt')
+        records = list(iter_threaded_records([gz, archive], workers=3, chunk_size=8192))
+        expected = list(iter_records(self.path)) * 2 + list(iter_records(SAMPLE_CHART))
+        self.assertEqual(repr(records), repr(expected))
+
+    def test_projection_and_early_close(self):
+        fields = {'S': ('horse_key', 'odds')}
+        records = list(iter_threaded_records(self.path, workers=2, chunk_size=2048, record_types='S', fields=fields))
+        self.assertEqual(repr(records), repr(list(iter_records(self.path, record_types='S', fields=fields))))
+        stream = iter_threaded_records(self.path, workers=2, chunk_size=1024, max_pending=2)
+        next(stream)
+        stream.close()
+
+    def test_projection_cache_is_shared_across_threads(self):
+        names = ('horse_name', 'official_finish')
+        classes = []
+        barrier = threading.Barrier(8)
+
+        def project():
+            barrier.wait()
+            classes.append(projected_class(StarterPerformanceData, names))
+        threads = [threading.Thread(target=project) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len({id(cls) for cls in classes}), 1)
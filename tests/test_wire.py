@@ -0,0 +1,72 @@
+#! python3
+
+
+import io
+import math
+import os
+import pickle
+import struct
+import unittest
+from dataclasses import astuple
+
+from pydrf.pool import StringPool, pooled_plans
+from pydrf.synthetic import write_synthetic_charts
+from pydrf.textchart import StarterPerformanceData, coded_plans, iter_records
+from pydrf.wire import WireBatch, dumps, loads, pack
+
+
+SAMPLE_CHART = os.path.join(os.path.dirname(__file__), 'data', 'sample_chart.txt')
+
+
+def bits(record) -> tuple:
+    return tuple(struct.pack('<d', value) if isinstance(value, float) else value for value in astuple(record))
+
+
+class WireFormatTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.records = list(iter_records(SAMPLE_CHART))
+
+    def test_round_trip(self):
+        restored = loads(dumps(self.records))
+        self.assertEqual([type(record) for record in restored], [type(record) for record in self.records])
+        self.assertEqual([bits(record) for record in restored], [bits(record) for record in self.records])
+        starters = [record for record in restored if isinstance(record, StarterPerformanceData)]
+        self.assertTrue(any(isinstance(value, float) and math.isnan(value)
+                            for starter in starters for value in astuple(starter)))
+
+    def test_compact_and_coded_records(self):
+        for records in (list(iter_records(SAMPLE_CHART, compact=True)),
+                        list(iter_records(SAMPLE_CHART, plans=coded_plans())),
+                        list(iter_records(SAMPLE_CHART, plans=pooled_plans(StringPool())))):
+            self.assertEqual(repr(loads(dumps(records))), repr(records))
+
+    def test_projected_records(self):
+        records = list(iter_records(SAMPLE_CHART, record_types=('R', 'S'),
+                                    fields={'S': ('horse_key', 'odds'), 'R': ('race_number',)}))
+        restored = loads(dumps(records))
+        self.assertEqual(repr(restored), repr(records))
+        self.assertEqual([type(record) for record in restored], [type(record) for record in records])
+
+    def test_smaller_than_pickled_records(self):
+        file = io.StringIO(newline='')
+        write_synthetic_charts(file, charts=3)
+        file.seek(0)
+        records = list(iter_records(file))
+        packed = dumps(records)
+        self.assertLess(len(packed), len(pickle.dumps(records, protocol=pickle.HIGHEST_PROTOCOL)) * 2 // 3)
+        self.assertEqual(repr(loads(packed)), repr(records))
+
+    def test_batch(self):
+        batch = pack(self.records)
+        self.assertIsInstance(batch, WireBatch)
+        self.assertEqual(len(batch), len(self.records))
+        self.assertEqual(batch.blocks[0].count, 1)
+        self.assertEqual(pack([]).unpack(), [])
+
+    def test_narrow_columns(self):
+        block = pack(self.records).blocks[2]
+        self.assertIs(block.record_class, StarterPerformanceData)
+        typecodes = {column.typecode for column in block.columns}
+        self.assertIn('b', typecodes)
+        self.assertNotIn('q', typecodes)